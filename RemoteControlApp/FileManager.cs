@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.IO;
 using System.Security.Cryptography;
 using System.Text;
@@ -8,7 +9,8 @@ namespace RemoteControlApp
     public class FileManager
     {
         private const int MaxFileSize = 100 * 1024 * 1024; // 100MB limit
-        private const int BufferSize = 64 * 1024; // 64KB buffer
+        public const int BufferSize = 64 * 1024; // 64KB buffer
+        public const string PartialSuffix = ".partial"; // Uploads are written here, then moved over the target
 
         public string ReadFileAsBase64(string filePath)
         {
@@ -94,6 +96,183 @@ namespace RemoteControlApp
             }
         }
 
+        public FileStream OpenFileForRead(string filePath)
+        {
+            if (string.IsNullOrWhiteSpace(filePath))
+                throw new ArgumentException("File path cannot be empty");
+
+            if (!File.Exists(filePath))
+            {
+                Logger.LogError($"File not found: {filePath}");
+                throw new FileNotFoundException($"File not found: {filePath}");
+            }
+
+            try
+            {
+                var stream = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read, BufferSize);
+                if (stream.Length > MaxFileSize)
+                {
+                    stream.Dispose();
+                    Logger.LogError($"File too large: {filePath}");
+                    throw new InvalidOperationException($"File too large. Maximum size is {MaxFileSize / (1024 * 1024)}MB");
+                }
+
+                Logger.LogAction("FILE_READ_ATTEMPT", $"Streaming file: {filePath} ({stream.Length} bytes)");
+                return stream;
+            }
+            catch (UnauthorizedAccessException ex)
+            {
+                Logger.LogError($"Access denied to file: {filePath} - {ex.Message}");
+                throw new UnauthorizedAccessException($"Access denied to file: {filePath}");
+            }
+        }
+
+        public long WriteFileFromStream(string filePath, Stream input, out string hash)
+        {
+            if (string.IsNullOrWhiteSpace(filePath))
+                throw new ArgumentException("File path cannot be empty");
+
+            try
+            {
+                // Ensure directory exists
+                string directory = Path.GetDirectoryName(filePath);
+                if (!string.IsNullOrEmpty(directory) && !Directory.Exists(directory))
+                {
+                    Logger.LogAction("DIRECTORY_CREATED", $"Creating directory: {directory}");
+                    Directory.CreateDirectory(directory);
+                }
+
+                Logger.LogAction("FILE_WRITE_ATTEMPT", $"Streaming file: {filePath}");
+                // Write beside the target so a broken upload leaves the existing file intact; the
+                // partial file is kept on failure so the upload can be resumed
+                string partialPath = filePath + PartialSuffix;
+                long totalWritten = 0;
+                bool tooLarge = false;
+                // Hash the bytes as they are written, so the client can verify the upload without a second read
+                using (var sha256 = SHA256.Create())
+                using (var output = new FileStream(partialPath, FileMode.Create, FileAccess.Write, FileShare.None, BufferSize))
+                {
+                    var buffer = new byte[BufferSize];
+                    int read;
+                    while ((read = input.Read(buffer, 0, buffer.Length)) > 0)
+                    {
+                        totalWritten += read;
+                        if (totalWritten > MaxFileSize)
+                        {
+                            tooLarge = true;
+                            break;
+                        }
+                        output.Write(buffer, 0, read);
+                        sha256.TransformBlock(buffer, 0, read, null, 0);
+                    }
+                    sha256.TransformFinalBlock(buffer, 0, 0);
+                    hash = Convert.ToBase64String(sha256.Hash);
+                }
+
+                if (tooLarge)
+                {
+                    File.Delete(partialPath);
+                    Logger.LogError($"File too large for write: {filePath}");
+                    throw new InvalidOperationException($"File too large. Maximum size is {MaxFileSize / (1024 * 1024)}MB");
+                }
+
+                ReplaceWithPartial(partialPath, filePath);
+                Logger.LogAction("FILE_WRITE_SUCCESS", $"Successfully wrote file: {filePath} ({totalWritten} bytes)");
+                return totalWritten;
+            }
+            catch (UnauthorizedAccessException ex)
+            {
+                Logger.LogError($"Access denied to file: {filePath} - {ex.Message}");
+                throw new UnauthorizedAccessException($"Access denied to file: {filePath}");
+            }
+            catch (IOException ex)
+            {
+                Logger.LogError($"Error writing file {filePath}: {ex.Message}");
+                throw new IOException($"Error writing file: {ex.Message}", ex);
+            }
+        }
+
+        public long WriteFileRangeFromStream(string filePath, long offset, long totalSize, Stream input, bool partial = false)
+        {
+            if (string.IsNullOrWhiteSpace(filePath))
+                throw new ArgumentException("File path cannot be empty");
+
+            if (offset < 0 || totalSize < 0 || offset > totalSize)
+                throw new ArgumentException("Invalid range offset or file size");
+
+            if (totalSize > MaxFileSize)
+                throw new InvalidOperationException($"File too large. Maximum size is {MaxFileSize / (1024 * 1024)}MB");
+
+            try
+            {
+                // Ensure directory exists
+                string directory = Path.GetDirectoryName(filePath);
+                if (!string.IsNullOrEmpty(directory) && !Directory.Exists(directory))
+                {
+                    Logger.LogAction("DIRECTORY_CREATED", $"Creating directory: {directory}");
+                    Directory.CreateDirectory(directory);
+                }
+
+                // Ranges of the same file may be written concurrently, so share write access.
+                // The file is only ever truncated, never pre-extended, so after sequential range
+                // writes its length tells a resuming client how much has been received.
+                // A resumed upload continues the partial file left by an interrupted whole-file upload
+                string targetPath = partial ? filePath + PartialSuffix : filePath;
+                long totalWritten = 0;
+                bool complete;
+                using (var output = new FileStream(targetPath, FileMode.OpenOrCreate, FileAccess.Write, FileShare.ReadWrite, BufferSize))
+                {
+                    if (output.Length > totalSize)
+                    {
+                        output.SetLength(totalSize);
+                    }
+                    output.Seek(offset, SeekOrigin.Begin);
+
+                    var buffer = new byte[BufferSize];
+                    int read;
+                    while ((read = input.Read(buffer, 0, buffer.Length)) > 0)
+                    {
+                        if (offset + totalWritten + read > totalSize)
+                            throw new InvalidOperationException("Range extends past the declared file size");
+
+                        output.Write(buffer, 0, read);
+                        totalWritten += read;
+                    }
+                    complete = output.Length == totalSize;
+                }
+
+                if (partial && complete)
+                {
+                    ReplaceWithPartial(targetPath, filePath);
+                }
+
+                Logger.LogAction("FILE_RANGE_WRITE_SUCCESS", $"Wrote {totalWritten} bytes at offset {offset} to: {filePath}");
+                return totalWritten;
+            }
+            catch (UnauthorizedAccessException ex)
+            {
+                Logger.LogError($"Access denied to file: {filePath} - {ex.Message}");
+                throw new UnauthorizedAccessException($"Access denied to file: {filePath}");
+            }
+            catch (IOException ex)
+            {
+                Logger.LogError($"Error writing file range {filePath}: {ex.Message}");
+                throw new IOException($"Error writing file: {ex.Message}", ex);
+            }
+        }
+
+        private static void ReplaceWithPartial(string partialPath, string filePath)
+        {
+            if (File.Exists(filePath))
+            {
+                File.Replace(partialPath, filePath, null);
+            }
+            else
+            {
+                File.Move(partialPath, filePath);
+            }
+        }
+
         public FileInfo GetFileInfo(string filePath)
         {
             if (string.IsNullOrWhiteSpace(filePath))
@@ -201,5 +380,46 @@ namespace RemoteControlApp
                 throw new IOException($"Error listing files: {ex.Message}", ex);
             }
         }
+
+        public FileInfo[] ListFileInfos(string directoryPath, string pattern = "*")
+        {
+            if (string.IsNullOrWhiteSpace(directoryPath))
+                throw new ArgumentException("Directory path cannot be empty");
+
+            if (!Directory.Exists(directoryPath))
+                throw new DirectoryNotFoundException($"Directory not found: {directoryPath}");
+
+            try
+            {
+                // Size and timestamps come back with the directory enumeration, so no per-file stat is needed
+                return new DirectoryInfo(directoryPath).GetFiles(pattern);
+            }
+            catch (UnauthorizedAccessException)
+            {
+                throw new UnauthorizedAccessException($"Access denied to directory: {directoryPath}");
+            }
+            catch (IOException ex)
+            {
+                throw new IOException($"Error listing files: {ex.Message}", ex);
+            }
+        }
+
+        public IEnumerable<string> EnumerateFiles(string directoryPath, string pattern = "*")
+        {
+            if (string.IsNullOrWhiteSpace(directoryPath))
+                throw new ArgumentException("Directory path cannot be empty");
+
+            if (!Directory.Exists(directoryPath))
+                throw new DirectoryNotFoundException($"Directory not found: {directoryPath}");
+
+            try
+            {
+                return Directory.EnumerateFiles(directoryPath, pattern);
+            }
+            catch (UnauthorizedAccessException)
+            {
+                throw new UnauthorizedAccessException($"Access denied to directory: {directoryPath}");
+            }
+        }
     }
 }
\ No newline at end of file
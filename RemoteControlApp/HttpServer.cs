@@ -1,5 +1,7 @@
 using System;
+using System.Collections.Generic;
 using System.IO;
+using System.IO.Compression;
 using System.Net;
 using System.Text;
 using System.Threading;
@@ -10,6 +12,9 @@ namespace RemoteControlApp
 {
     public class HttpServer : IDisposable
     {
+        private const int FileListBatchSize = 256; // Paths written per chunk when streaming a listing
+        private const int CompressResponseMinSize = 4096; // Smaller JSON responses aren't worth gzipping
+
         private readonly HttpListener _listener;
         private readonly CancellationTokenSource _cancellationTokenSource;
         private readonly ShellManager _shellManager;
@@ -84,10 +89,25 @@ namespace RemoteControlApp
                     return;
                 }
 
+                if (request.Url.AbsolutePath.Equals("/file", StringComparison.OrdinalIgnoreCase))
+                {
+                    ProcessFileTransfer(request, response);
+                    response.Close();
+                    return;
+                }
+
+                if (request.Url.AbsolutePath.Equals("/files", StringComparison.OrdinalIgnoreCase))
+                {
+                    ProcessFileListStream(request, response);
+                    return;
+                }
+
                 if (request.HttpMethod == "POST")
                 {
                     string requestBody;
-                    using (var reader = new StreamReader(request.InputStream, request.ContentEncoding))
+                    var gzippedRequest = string.Equals(request.Headers["Content-Encoding"], "gzip", StringComparison.OrdinalIgnoreCase);
+                    using (var input = gzippedRequest ? new GZipStream(request.InputStream, CompressionMode.Decompress) : request.InputStream)
+                    using (var reader = new StreamReader(input, request.ContentEncoding))
                     {
                         requestBody = reader.ReadToEnd();
                     }
@@ -97,6 +117,14 @@ namespace RemoteControlApp
                     var responseText = ProcessCommand(requestBody);
                     var buffer = Encoding.UTF8.GetBytes(responseText);
 
+                    // Large responses (e.g. verbose shell output) are gzipped for clients that accept it
+                    var acceptEncoding = request.Headers["Accept-Encoding"] ?? "";
+                    if (buffer.Length >= CompressResponseMinSize && acceptEncoding.IndexOf("gzip", StringComparison.OrdinalIgnoreCase) >= 0)
+                    {
+                        buffer = GzipBytes(buffer);
+                        response.AddHeader("Content-Encoding", "gzip");
+                    }
+
                     response.ContentType = "application/json";
                     response.ContentLength64 = buffer.Length;
                     response.StatusCode = 200;
@@ -137,6 +165,176 @@ namespace RemoteControlApp
             }
         }
 
+        private void ProcessFileTransfer(HttpListenerRequest request, HttpListenerResponse response)
+        {
+            var filePath = request.QueryString["path"];
+            if (string.IsNullOrEmpty(filePath))
+            {
+                Logger.LogRequest(request.HttpMethod, "file_transfer", "ERROR: File path is required");
+                WriteJsonResponse(response, 400, CreateJsonResponse(false, "File path is required"));
+                return;
+            }
+
+            var headersSent = false;
+            try
+            {
+                if (request.HttpMethod == "GET")
+                {
+                    Logger.LogRequest("GET", "file_download_binary", $"Path: {filePath}");
+                    using (var fileStream = _fileManager.OpenFileForRead(filePath))
+                    {
+                        response.ContentType = "application/octet-stream";
+                        response.ContentLength64 = fileStream.Length;
+                        response.StatusCode = 200;
+                        headersSent = true;
+                        using (var output = response.OutputStream)
+                        {
+                            fileStream.CopyTo(output, FileManager.BufferSize);
+                        }
+                        Logger.LogAction("FILE_DOWNLOADED", $"Successfully downloaded: {filePath}, Size: {fileStream.Length} bytes");
+                    }
+                }
+                else if (request.HttpMethod == "POST")
+                {
+                    long bytesWritten;
+                    string hash = null;
+                    var offsetParam = request.QueryString["offset"];
+                    if (offsetParam != null)
+                    {
+                        // Byte range of a file uploaded in parallel pieces; "size" is the final file size
+                        var sizeParam = request.QueryString["size"];
+                        if (sizeParam == null)
+                        {
+                            WriteJsonResponse(response, 400, CreateJsonResponse(false, "File size is required for range uploads"));
+                            return;
+                        }
+                        var offset = long.Parse(offsetParam);
+                        var totalSize = long.Parse(sizeParam);
+                        Logger.LogRequest("POST", "file_upload_range", $"Path: {filePath}, Offset: {offset}, Content length: {request.ContentLength64} bytes");
+                        // "partial=1" resumes an interrupted whole-file upload from its partial file
+                        var partial = request.QueryString["partial"] == "1";
+                        bytesWritten = _fileManager.WriteFileRangeFromStream(filePath, offset, totalSize, request.InputStream, partial);
+                    }
+                    else
+                    {
+                        Logger.LogRequest("POST", "file_upload_binary", $"Path: {filePath}, Content length: {request.ContentLength64} bytes");
+                        var gzipped = string.Equals(request.Headers["Content-Encoding"], "gzip", StringComparison.OrdinalIgnoreCase);
+                        using (var input = gzipped ? new GZipStream(request.InputStream, CompressionMode.Decompress) : request.InputStream)
+                        {
+                            bytesWritten = _fileManager.WriteFileFromStream(filePath, input, out hash);
+                        }
+                        Logger.LogAction("FILE_UPLOADED", $"Successfully uploaded to: {filePath}, Size: {bytesWritten} bytes");
+                    }
+                    // Whole-file uploads also report the SHA-256 of the bytes written
+                    var hashJson = hash != null ? ", \"hash\": \"" + hash + "\"" : "";
+                    WriteJsonResponse(response, 200, "{\"success\": true, \"message\": \"File uploaded successfully\", \"size\": " + bytesWritten + hashJson + "}");
+                }
+                else
+                {
+                    response.StatusCode = 405;
+                    Logger.LogRequest(request.HttpMethod, "METHOD_NOT_ALLOWED", $"Unsupported method for /file: {request.HttpMethod}");
+                }
+            }
+            catch (Exception ex) when (headersSent)
+            {
+                // Status and Content-Length are already sent; abort so the client sees a truncated body
+                Logger.LogError($"File download failed for {filePath} after headers were sent: {ex.Message}");
+                response.Abort();
+            }
+            catch (FileNotFoundException ex)
+            {
+                Logger.LogError($"File transfer failed for {filePath}: {ex.Message}");
+                WriteJsonResponse(response, 404, CreateJsonResponse(false, ex.Message));
+            }
+            catch (Exception ex)
+            {
+                Logger.LogError($"File transfer failed for {filePath}: {ex.Message}");
+                WriteJsonResponse(response, 500, CreateJsonResponse(false, "File transfer failed: " + ex.Message));
+            }
+        }
+
+        private void ProcessFileListStream(HttpListenerRequest request, HttpListenerResponse response)
+        {
+            var listPath = request.QueryString["path"];
+            var pattern = request.QueryString["pattern"] ?? "*";
+
+            if (request.HttpMethod != "GET")
+            {
+                response.StatusCode = 405;
+                Logger.LogRequest(request.HttpMethod, "METHOD_NOT_ALLOWED", $"Unsupported method for /files: {request.HttpMethod}");
+                response.Close();
+                return;
+            }
+
+            if (string.IsNullOrEmpty(listPath))
+            {
+                WriteJsonResponse(response, 400, CreateJsonResponse(false, "Directory path is required"));
+                response.Close();
+                return;
+            }
+
+            IEnumerator<string> files;
+            try
+            {
+                Logger.LogRequest("GET", "file_list_stream", $"Path: {listPath}, Pattern: {pattern}");
+                files = _fileManager.EnumerateFiles(listPath, pattern).GetEnumerator();
+            }
+            catch (DirectoryNotFoundException ex)
+            {
+                WriteJsonResponse(response, 404, CreateJsonResponse(false, ex.Message));
+                response.Close();
+                return;
+            }
+            catch (Exception ex)
+            {
+                WriteJsonResponse(response, 500, CreateJsonResponse(false, "Failed to list files: " + ex.Message));
+                response.Close();
+                return;
+            }
+
+            // One JSON string per line, sent in chunks while the directory is still being enumerated
+            response.ContentType = "application/x-ndjson";
+            response.SendChunked = true;
+            response.StatusCode = 200;
+
+            var count = 0;
+            try
+            {
+                using (files)
+                using (var writer = new StreamWriter(response.OutputStream, new UTF8Encoding(false), FileManager.BufferSize))
+                {
+                    while (files.MoveNext())
+                    {
+                        writer.Write("\"" + EscapeJsonString(files.Current) + "\"\n");
+                        if (++count % FileListBatchSize == 0)
+                        {
+                            writer.Flush();
+                        }
+                    }
+                }
+                Logger.LogAction("FILES_LISTED", $"Streamed {count} files from: {listPath}");
+                response.Close();
+            }
+            catch (Exception ex)
+            {
+                // Headers are already sent; abort so the client sees a truncated stream rather than a partial listing
+                Logger.LogError($"File list stream failed for {listPath} after {count} files: {ex.Message}");
+                response.Abort();
+            }
+        }
+
+        private void WriteJsonResponse(HttpListenerResponse response, int statusCode, string responseText)
+        {
+            var buffer = Encoding.UTF8.GetBytes(responseText);
+            response.StatusCode = statusCode;
+            response.ContentType = "application/json";
+            response.ContentLength64 = buffer.Length;
+            using (var output = response.OutputStream)
+            {
+                output.Write(buffer, 0, buffer.Length);
+            }
+        }
+
         private string ProcessCommand(string jsonCommand)
         {
             try
@@ -226,6 +424,13 @@ namespace RemoteControlApp
                     case "shell_output":
                         try
                         {
+                            // Optionally long-poll so idle callers don't need to poll repeatedly
+                            var waitMs = ExtractJsonInt(jsonCommand, "wait_ms", 0);
+                            if (waitMs > 0)
+                            {
+                                _shellManager.WaitForOutput(waitMs);
+                            }
+
                             var output = _shellManager.GetOutput();
                             var error = _shellManager.GetError();
                             return CreateShellOutputResponse(output, error);
@@ -235,6 +440,41 @@ namespace RemoteControlApp
                             return CreateJsonResponse(false, "Failed to get output: " + ex.Message);
                         }
 
+                    case "shell_exec":
+                        var execInput = ExtractJsonValue(jsonCommand, "input");
+                        if (execInput == null)
+                        {
+                            Logger.LogRequest("POST", "shell_exec", "ERROR: Input is required");
+                            return CreateJsonResponse(false, "Input is required");
+                        }
+
+                        try
+                        {
+                            var execDirectory = ExtractJsonValue(jsonCommand, "working_directory");
+                            var autoStart = ExtractJsonBool(jsonCommand, "auto_start", true);
+                            var timeoutMs = ExtractJsonInt(jsonCommand, "timeout_ms", 5000);
+                            var idleMs = ExtractJsonInt(jsonCommand, "idle_ms", 300);
+                            Logger.LogRequest("POST", "shell_exec", $"Command: {execInput}, Timeout: {timeoutMs}ms");
+
+                            if (!_shellManager.IsRunning)
+                            {
+                                if (!autoStart)
+                                {
+                                    return CreateJsonResponse(false, "Shell is not running");
+                                }
+                                _shellManager.StartShell(execDirectory);
+                            }
+
+                            var timedOut = _shellManager.ExecuteAndWait(execInput, timeoutMs, idleMs, out string execOutput, out string execError);
+                            Logger.LogAction("SHELL_EXEC", $"Executed: {execInput}");
+                            return CreateShellExecResponse(execOutput, execError, timedOut);
+                        }
+                        catch (Exception ex)
+                        {
+                            Logger.LogError($"Failed to execute shell command: {ex.Message}");
+                            return CreateJsonResponse(false, "Failed to execute command: " + ex.Message);
+                        }
+
                     case "shell_stop":
                         try
                         {
@@ -356,6 +596,33 @@ namespace RemoteControlApp
                             var fileHash = _fileManager.GetFileHash(infoPath);
                             return CreateFileInfoResponse(fileInfo, fileHash);
                         }
+                        catch (FileNotFoundException)
+                        {
+                            // Report a missing file as a normal result so callers don't need a separate file_exists probe
+                            return CreateFileExistsResponse(false);
+                        }
+                        catch (Exception ex)
+                        {
+                            return CreateJsonResponse(false, "Failed to get file info: " + ex.Message);
+                        }
+
+                    case "file_stat":
+                        var statPath = ExtractJsonValue(jsonCommand, "path");
+                        if (string.IsNullOrEmpty(statPath))
+                        {
+                            return CreateJsonResponse(false, "File path is required");
+                        }
+
+                        try
+                        {
+                            // Same as file_info without the hash, which requires reading the whole file
+                            var statInfo = _fileManager.GetFileInfo(statPath);
+                            return CreateFileInfoResponse(statInfo, null);
+                        }
+                        catch (FileNotFoundException)
+                        {
+                            return CreateFileExistsResponse(false);
+                        }
                         catch (Exception ex)
                         {
                             return CreateJsonResponse(false, "Failed to get file info: " + ex.Message);
@@ -376,6 +643,11 @@ namespace RemoteControlApp
                             Logger.LogAction("FILE_DELETED", $"Successfully deleted: {deletePath}");
                             return CreateJsonResponse(true, "File deleted successfully");
                         }
+                        catch (FileNotFoundException)
+                        {
+                            // A missing file is an expected outcome, not a server error
+                            return CreateFileExistsResponse(false);
+                        }
                         catch (Exception ex)
                         {
                             Logger.LogError($"Failed to delete file {deletePath}: {ex.Message}");
@@ -400,6 +672,48 @@ namespace RemoteControlApp
                             return CreateJsonResponse(false, "Failed to list files: " + ex.Message);
                         }
 
+                    case "file_list_detail":
+                        var detailPath = ExtractJsonValue(jsonCommand, "path");
+                        var detailPattern = ExtractJsonValue(jsonCommand, "pattern");
+                        var includeHash = ExtractJsonBool(jsonCommand, "include_hash", false);
+                        if (string.IsNullOrEmpty(detailPath))
+                        {
+                            return CreateJsonResponse(false, "Directory path is required");
+                        }
+
+                        try
+                        {
+                            // Listing plus per-file info in one round trip instead of file_list followed by N file_info calls
+                            var fileInfos = _fileManager.ListFileInfos(detailPath, detailPattern ?? "*");
+                            return CreateFileListDetailResponse(fileInfos, includeHash);
+                        }
+                        catch (Exception ex)
+                        {
+                            return CreateJsonResponse(false, "Failed to list files: " + ex.Message);
+                        }
+
+                    case "batch":
+                        var subCommands = ExtractJsonObjectArray(jsonCommand, "requests");
+                        if (subCommands == null)
+                        {
+                            return CreateJsonResponse(false, "Requests array is required");
+                        }
+
+                        Logger.LogRequest("POST", "batch", $"Requests: {subCommands.Count}");
+                        var results = new StringBuilder();
+                        results.Append("[");
+                        for (int i = 0; i < subCommands.Count; i++)
+                        {
+                            if (i > 0) results.Append(", ");
+                            // Each request is answered exactly as if it had been sent on its own
+                            var subAction = ExtractJsonValue(subCommands[i], "action");
+                            results.Append(string.Equals(subAction, "batch", StringComparison.OrdinalIgnoreCase)
+                                ? CreateJsonResponse(false, "Batches cannot be nested")
+                                : ProcessCommand(subCommands[i]));
+                        }
+                        results.Append("]");
+                        return "{\"success\": true, \"results\": " + results.ToString() + "}";
+
                     default:
                         return CreateJsonResponse(false, "Unknown action");
                 }
@@ -473,6 +787,90 @@ namespace RemoteControlApp
             }
         }
 
+        private static byte[] GzipBytes(byte[] data)
+        {
+            using (var compressed = new MemoryStream())
+            {
+                using (var gzip = new GZipStream(compressed, CompressionLevel.Fastest))
+                {
+                    gzip.Write(data, 0, data.Length);
+                }
+                return compressed.ToArray();
+            }
+        }
+
+        private List<string> ExtractJsonObjectArray(string json, string key)
+        {
+            // Returns the raw JSON text of each object in an array value, or null if the key is missing
+            var keyMatch = Regex.Match(json, "\"" + key + "\"\\s*:\\s*\\[", RegexOptions.IgnoreCase);
+            if (!keyMatch.Success)
+                return null;
+
+            var objects = new List<string>();
+            int depth = 0;
+            int objectStart = -1;
+            bool inString = false;
+            bool escapeNext = false;
+
+            for (int i = keyMatch.Index + keyMatch.Length; i < json.Length; i++)
+            {
+                char c = json[i];
+
+                if (inString)
+                {
+                    if (escapeNext)
+                        escapeNext = false;
+                    else if (c == '\\')
+                        escapeNext = true;
+                    else if (c == '"')
+                        inString = false;
+                }
+                else if (c == '"')
+                {
+                    inString = true;
+                }
+                else if (c == '{')
+                {
+                    if (depth == 0)
+                        objectStart = i;
+                    depth++;
+                }
+                else if (c == '}')
+                {
+                    depth--;
+                    if (depth == 0)
+                        objects.Add(json.Substring(objectStart, i - objectStart + 1));
+                }
+                else if (c == ']' && depth == 0)
+                {
+                    return objects;
+                }
+            }
+
+            // Unterminated array
+            return null;
+        }
+
+        private int ExtractJsonInt(string json, string key, int defaultValue)
+        {
+            var match = Regex.Match(json, "\"" + key + "\"\\s*:\\s*(-?\\d+)", RegexOptions.IgnoreCase);
+            if (match.Success && int.TryParse(match.Groups[1].Value, out int value))
+            {
+                return value;
+            }
+            return defaultValue;
+        }
+
+        private bool ExtractJsonBool(string json, string key, bool defaultValue)
+        {
+            var match = Regex.Match(json, "\"" + key + "\"\\s*:\\s*(true|false)", RegexOptions.IgnoreCase);
+            if (match.Success)
+            {
+                return match.Groups[1].Value.ToLower() == "true";
+            }
+            return defaultValue;
+        }
+
         private string CreateJsonResponse(bool success, string message)
         {
             if (success)
@@ -493,6 +891,14 @@ namespace RemoteControlApp
             return "{\"success\": true, \"output\": " + outputJson + ", \"error\": " + errorJson + "}";
         }
 
+        private string CreateShellExecResponse(string output, string error, bool timedOut)
+        {
+            var outputJson = string.IsNullOrEmpty(output) ? "\"\"" : "\"" + EscapeJsonString(output) + "\"";
+            var errorJson = string.IsNullOrEmpty(error) ? "\"\"" : "\"" + EscapeJsonString(error) + "\"";
+
+            return "{\"success\": true, \"output\": " + outputJson + ", \"error\": " + errorJson + ", \"timed_out\": " + (timedOut ? "true" : "false") + "}";
+        }
+
         private string CreateShellStatusResponse(bool isRunning)
         {
             return "{\"success\": true, \"running\": " + (isRunning ? "true" : "false") + "}";
@@ -514,15 +920,36 @@ namespace RemoteControlApp
         }
 
         private string CreateFileInfoResponse(FileInfo fileInfo, string hash)
+        {
+            return "{\"success\": true, \"exists\": true, " + CreateFileInfoFields(fileInfo, hash) + "}";
+        }
+
+        private string CreateFileInfoFields(FileInfo fileInfo, string hash)
         {
             var nameJson = "\"" + EscapeJsonString(fileInfo.Name) + "\"";
             var fullNameJson = "\"" + EscapeJsonString(fileInfo.FullName) + "\"";
             var sizeJson = fileInfo.Length.ToString();
             var createdJson = "\"" + fileInfo.CreationTime.ToString("yyyy-MM-ddTHH:mm:ss.fffZ") + "\"";
             var modifiedJson = "\"" + fileInfo.LastWriteTime.ToString("yyyy-MM-ddTHH:mm:ss.fffZ") + "\"";
-            var hashJson = "\"" + EscapeJsonString(hash) + "\"";
+            var hashJson = hash != null ? ", \"hash\": \"" + EscapeJsonString(hash) + "\"" : "";
             
-            return "{\"success\": true, \"name\": " + nameJson + ", \"fullName\": " + fullNameJson + ", \"size\": " + sizeJson + ", \"created\": " + createdJson + ", \"modified\": " + modifiedJson + ", \"hash\": " + hashJson + "}";
+            return "\"name\": " + nameJson + ", \"fullName\": " + fullNameJson + ", \"size\": " + sizeJson + ", \"created\": " + createdJson + ", \"modified\": " + modifiedJson + hashJson;
+        }
+
+        private string CreateFileListDetailResponse(FileInfo[] files, bool includeHash)
+        {
+            var fileList = new StringBuilder();
+            fileList.Append("[");
+            
+            for (int i = 0; i < files.Length; i++)
+            {
+                if (i > 0) fileList.Append(", ");
+                var hash = includeHash ? _fileManager.GetFileHash(files[i].FullName) : null;
+                fileList.Append("{" + CreateFileInfoFields(files[i], hash) + "}");
+            }
+            
+            fileList.Append("]");
+            return "{\"success\": true, \"files\": " + fileList.ToString() + "}";
         }
 
         private string CreateFileListResponse(string[] files)
@@ -18,6 +18,8 @@ namespace RemoteControlApp
         private Task _outputReaderTask;
         private Task _errorReaderTask;
         private readonly object _processLock = new object();
+        // Pulsed whenever a line is queued, so waiters wake on output instead of polling
+        private readonly object _outputSignal = new object();
 
         public bool IsRunning 
         { 
@@ -174,6 +176,91 @@ namespace RemoteControlApp
             return result;
         }
 
+        public bool WaitForOutput(int timeoutMs)
+        {
+            // Returns as soon as output or error text is queued, or false once timeoutMs has elapsed
+            var stopwatch = Stopwatch.StartNew();
+            lock (_outputSignal)
+            {
+                while (_outputBuffer.IsEmpty && _errorBuffer.IsEmpty)
+                {
+                    var remainingMs = timeoutMs - stopwatch.ElapsedMilliseconds;
+                    if (remainingMs <= 0)
+                    {
+                        return false;
+                    }
+
+                    Monitor.Wait(_outputSignal, (int)remainingMs);
+                }
+            }
+            return true;
+        }
+
+        public bool ExecuteAndWait(string input, int timeoutMs, int idleMs, out string output, out string error)
+        {
+            SendInput(input);
+
+            var outputBuilder = new StringBuilder();
+            var errorBuilder = new StringBuilder();
+            var stopwatch = Stopwatch.StartNew();
+            long lastActivityMs = 0;
+            bool receivedAny = false;
+            bool timedOut = false;
+
+            // Collect output until the shell has gone quiet for idleMs, or until timeoutMs has elapsed
+            while (true)
+            {
+                bool gotOutput = DrainBuffer(_outputBuffer, outputBuilder);
+                bool gotError = DrainBuffer(_errorBuffer, errorBuilder);
+                if (gotOutput || gotError)
+                {
+                    receivedAny = true;
+                    lastActivityMs = stopwatch.ElapsedMilliseconds;
+                }
+
+                if (receivedAny && stopwatch.ElapsedMilliseconds - lastActivityMs >= idleMs)
+                {
+                    break;
+                }
+
+                if (stopwatch.ElapsedMilliseconds >= timeoutMs)
+                {
+                    timedOut = true;
+                    break;
+                }
+
+                // Sleep until more output is queued, the idle period ends or the timeout expires
+                var waitMs = timeoutMs - stopwatch.ElapsedMilliseconds;
+                if (receivedAny)
+                {
+                    waitMs = Math.Min(waitMs, idleMs - (stopwatch.ElapsedMilliseconds - lastActivityMs));
+                }
+                lock (_outputSignal)
+                {
+                    if (waitMs > 0 && _outputBuffer.IsEmpty && _errorBuffer.IsEmpty)
+                    {
+                        Monitor.Wait(_outputSignal, (int)waitMs);
+                    }
+                }
+            }
+
+            output = outputBuilder.ToString();
+            error = errorBuilder.ToString();
+            Logger.LogAction("SHELL_EXEC_COMPLETED", $"Collected {output.Length} output and {error.Length} error characters in {stopwatch.ElapsedMilliseconds}ms, timed out: {timedOut}");
+            return timedOut;
+        }
+
+        private static bool DrainBuffer(ConcurrentQueue<string> buffer, StringBuilder target)
+        {
+            bool drained = false;
+            while (buffer.TryDequeue(out string line))
+            {
+                target.AppendLine(line);
+                drained = true;
+            }
+            return drained;
+        }
+
         public void StopShell()
         {
             lock (_processLock)
@@ -235,7 +322,7 @@ namespace RemoteControlApp
                                 {
                                     line = line.Substring(0, line.Length - 1);
                                 }
-                                buffer.Enqueue(line);
+                                EnqueueLine(buffer, line);
                                 linesRead++;
                                 lineBuffer.Clear();
                             }
@@ -250,7 +337,7 @@ namespace RemoteControlApp
                         // and the buffer is not empty, add it as a line to ensure output is not lost
                         if (lineBuffer.Length > 0 && reader.Peek() == -1)
                         {
-                            buffer.Enqueue(lineBuffer.ToString());
+                            EnqueueLine(buffer, lineBuffer.ToString());
                             linesRead++;
                             lineBuffer.Clear();
                         }
@@ -260,7 +347,7 @@ namespace RemoteControlApp
                         // No more data available, but check if we have a partial line
                         if (lineBuffer.Length > 0)
                         {
-                            buffer.Enqueue(lineBuffer.ToString());
+                            EnqueueLine(buffer, lineBuffer.ToString());
                             linesRead++;
                             lineBuffer.Clear();
                         }
@@ -272,7 +359,7 @@ namespace RemoteControlApp
                 // Handle any remaining content in the buffer when the stream ends
                 if (lineBuffer.Length > 0)
                 {
-                    buffer.Enqueue(lineBuffer.ToString());
+                    EnqueueLine(buffer, lineBuffer.ToString());
                     linesRead++;
                 }
                 
@@ -284,6 +371,15 @@ namespace RemoteControlApp
             }
         }
 
+        private void EnqueueLine(ConcurrentQueue<string> buffer, string line)
+        {
+            buffer.Enqueue(line);
+            lock (_outputSignal)
+            {
+                Monitor.PulseAll(_outputSignal);
+            }
+        }
+
         private void CleanupProcess()
         {
             try
@@ -8,11 +8,13 @@ as MCP tools that can be used by MCP clients like Claude Desktop.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import sys
 import os
-from typing import Any, Dict, List, Optional, Sequence
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 # MCP imports
 from mcp.server import Server, NotificationOptions
@@ -27,6 +29,11 @@ from mcp.types import (
     LoggingLevel
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Local imports
 from remote_control_client import RemoteControlClient
 
@@ -34,12 +41,311 @@ from remote_control_client import RemoteControlClient
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp-winremote-server")
 
+# Read-only tools whose concurrent identical calls share a single request
+_COALESCED_TOOLS = frozenset({"test_connection", "get_status", "shell_status", "file_exists", "get_file_info"})
+
+# Seconds the client reuses file_exists/get_file_info/list_files results
+_PATH_CACHE_TTL = 2.0
+
+# Lifetime (seconds) of cached test_connection/get_status results
+_CONNECTION_CACHE_TTL = 5.0
+
+# Backoff schedule (seconds) when polling for shell output after sending a command
+_OUTPUT_POLL_DELAYS = (0.02, 0.04, 0.08, 0.16, 0.32)
+
+def _dump(obj: Any) -> str:
+    """Serialize a tool result to compact JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+def _tool_response(handler: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Awaitable[Sequence[TextContent]]]:
+    """Wrap a tool handler returning a result dict so it produces an MCP text response.
+    
+    Handlers may catch their own exceptions to add context to the error result; anything
+    they let through is reported as {"success": false, "error": ...}.
+    """
+    @functools.wraps(handler)
+    async def wrapper(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+        try:
+            result = await handler(self, arguments)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        return [TextContent(type="text", text=_dump(result))]
+    return wrapper
+
+# Tool definitions are static, so build them once at import time and hand the
+# same list back on every tools/list request.
+_TOOLS: List[Tool] = [
+    # Browser control
+    Tool(
+        name="launch_browser",
+        description="Launch the default browser on Windows with a specified URL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "The URL to open in the browser"
+                }
+            },
+            "required": ["url"]
+        }
+    ),
+    
+    # Shell operations
+    Tool(
+        name="shell_start",
+        description="Start a Windows Command Prompt shell session",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "working_directory": {
+                    "type": "string",
+                    "description": "Initial working directory for the shell (optional)"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="shell_stop",
+        description="Stop the current Windows shell session",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="shell_status",
+        description="Check if a Windows shell session is currently running",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="shell_command",
+        description="Execute a command in the Windows shell and get output",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "command": {
+                    "type": "string",
+                    "description": "The command to execute in the Windows shell"
+                },
+                "auto_start": {
+                    "type": "boolean",
+                    "description": "Automatically start shell if not running (default: true)",
+                    "default": True
+                },
+                "working_directory": {
+                    "type": "string",
+                    "description": "Working directory to use when starting shell (only used if auto_start is true)"
+                }
+            },
+            "required": ["command"]
+        }
+    ),
+    Tool(
+        name="shell_get_output",
+        description="Get pending output from the Windows shell",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="shell_cd",
+        description="Change the working directory of the running Windows shell",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": "The directory path to change to"
+                }
+            },
+            "required": ["directory"]
+        }
+    ),
+    
+    # File operations
+    Tool(
+        name="upload_file",
+        description="Upload a local file to the Windows machine",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "local_path": {
+                    "type": "string",
+                    "description": "Path to the local file to upload"
+                },
+                "remote_path": {
+                    "type": "string",
+                    "description": "Path where the file should be saved on Windows (e.g., 'C:/temp/file.txt')"
+                }
+            },
+            "required": ["local_path", "remote_path"]
+        }
+    ),
+    Tool(
+        name="download_file",
+        description="Download a file from the Windows machine to local system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "remote_path": {
+                    "type": "string",
+                    "description": "Path to the file on Windows (e.g., 'C:/temp/file.txt')"
+                },
+                "local_path": {
+                    "type": "string",
+                    "description": "Path where the file should be saved locally"
+                }
+            },
+            "required": ["remote_path", "local_path"]
+        }
+    ),
+    Tool(
+        name="file_exists",
+        description="Check if a file exists on the Windows machine",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to check on Windows (e.g., 'C:/temp/file.txt')"
+                }
+            },
+            "required": ["path"]
+        }
+    ),
+    Tool(
+        name="get_file_info",
+        description="Get detailed information about a file on Windows",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the file on Windows (e.g., 'C:/temp/file.txt')"
+                }
+            },
+            "required": ["path"]
+        }
+    ),
+    Tool(
+        name="delete_file",
+        description="Delete a file on the Windows machine",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the file to delete on Windows (e.g., 'C:/temp/file.txt')"
+                }
+            },
+            "required": ["path"]
+        }
+    ),
+    Tool(
+        name="list_files",
+        description="List files in a directory on the Windows machine",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Directory path on Windows (e.g., 'C:/temp/')"
+                },
+                "pattern": {
+                    "type": "string",
+                    "description": "File pattern to match (e.g., '*.txt', default: '*')",
+                    "default": "*"
+                }
+            },
+            "required": ["path"]
+        }
+    ),
+    
+    # Connection management
+    Tool(
+        name="test_connection",
+        description="Test connection to the Windows Remote Control service",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_status",
+        description="Get status information about the connection",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="configure_connection",
+        description="Configure the connection host and port",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "host": {
+                    "type": "string",
+                    "description": "Host to connect to (default: localhost)",
+                    "default": "localhost"
+                },
+                "port": {
+                    "type": "integer",
+                    "description": "Port to connect to (default: 8417)",
+                    "default": 8417
+                }
+            },
+            "required": []
+        }
+    )
+]
+
 class WinRemoteMCPServer:
     def __init__(self):
         self.server = Server("winremote-mcp-server")
         self.client: Optional[RemoteControlClient] = None
         self.host = "localhost"
         self.port = 8417
+        self._init_lock = asyncio.Lock()
+        # Last known state of the remote shell; None when unknown
+        self._shell_running: Optional[bool] = None
+        # In-flight read-only tool calls, keyed by tool name and arguments
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        # Recent connection probe and status results: key -> (fetch time, value)
+        self._connection_cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Tool name -> handler coroutine
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[Sequence[TextContent]]]] = {
+            "launch_browser": self._launch_browser,
+            "shell_start": self._shell_start,
+            "shell_stop": self._shell_stop,
+            "shell_status": self._shell_status,
+            "shell_command": self._shell_command,
+            "shell_get_output": self._shell_get_output,
+            "shell_cd": self._shell_cd,
+            "upload_file": self._upload_file,
+            "download_file": self._download_file,
+            "file_exists": self._file_exists,
+            "get_file_info": self._get_file_info,
+            "delete_file": self._delete_file,
+            "list_files": self._list_files,
+            "test_connection": self._test_connection,
+            "get_status": self._get_status,
+            "configure_connection": self._configure_connection,
+        }
         
         # Register tools
         self._register_tools()
@@ -50,242 +356,7 @@ class WinRemoteMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """List available Windows Remote Control tools."""
-            return [
-                # Browser control
-                Tool(
-                    name="launch_browser",
-                    description="Launch the default browser on Windows with a specified URL",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "url": {
-                                "type": "string",
-                                "description": "The URL to open in the browser"
-                            }
-                        },
-                        "required": ["url"]
-                    }
-                ),
-                
-                # Shell operations
-                Tool(
-                    name="shell_start",
-                    description="Start a Windows Command Prompt shell session",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "working_directory": {
-                                "type": "string",
-                                "description": "Initial working directory for the shell (optional)"
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="shell_stop",
-                    description="Stop the current Windows shell session",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="shell_status",
-                    description="Check if a Windows shell session is currently running",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="shell_command",
-                    description="Execute a command in the Windows shell and get output",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "command": {
-                                "type": "string",
-                                "description": "The command to execute in the Windows shell"
-                            },
-                            "auto_start": {
-                                "type": "boolean",
-                                "description": "Automatically start shell if not running (default: true)",
-                                "default": True
-                            },
-                            "working_directory": {
-                                "type": "string",
-                                "description": "Working directory to use when starting shell (only used if auto_start is true)"
-                            }
-                        },
-                        "required": ["command"]
-                    }
-                ),
-                Tool(
-                    name="shell_get_output",
-                    description="Get pending output from the Windows shell",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="shell_cd",
-                    description="Change the working directory of the running Windows shell",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "directory": {
-                                "type": "string",
-                                "description": "The directory path to change to"
-                            }
-                        },
-                        "required": ["directory"]
-                    }
-                ),
-                
-                # File operations
-                Tool(
-                    name="upload_file",
-                    description="Upload a local file to the Windows machine",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "local_path": {
-                                "type": "string",
-                                "description": "Path to the local file to upload"
-                            },
-                            "remote_path": {
-                                "type": "string",
-                                "description": "Path where the file should be saved on Windows (e.g., 'C:/temp/file.txt')"
-                            }
-                        },
-                        "required": ["local_path", "remote_path"]
-                    }
-                ),
-                Tool(
-                    name="download_file",
-                    description="Download a file from the Windows machine to local system",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "remote_path": {
-                                "type": "string",
-                                "description": "Path to the file on Windows (e.g., 'C:/temp/file.txt')"
-                            },
-                            "local_path": {
-                                "type": "string",
-                                "description": "Path where the file should be saved locally"
-                            }
-                        },
-                        "required": ["remote_path", "local_path"]
-                    }
-                ),
-                Tool(
-                    name="file_exists",
-                    description="Check if a file exists on the Windows machine",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to check on Windows (e.g., 'C:/temp/file.txt')"
-                            }
-                        },
-                        "required": ["path"]
-                    }
-                ),
-                Tool(
-                    name="get_file_info",
-                    description="Get detailed information about a file on Windows",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to the file on Windows (e.g., 'C:/temp/file.txt')"
-                            }
-                        },
-                        "required": ["path"]
-                    }
-                ),
-                Tool(
-                    name="delete_file",
-                    description="Delete a file on the Windows machine",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to the file to delete on Windows (e.g., 'C:/temp/file.txt')"
-                            }
-                        },
-                        "required": ["path"]
-                    }
-                ),
-                Tool(
-                    name="list_files",
-                    description="List files in a directory on the Windows machine",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Directory path on Windows (e.g., 'C:/temp/')"
-                            },
-                            "pattern": {
-                                "type": "string",
-                                "description": "File pattern to match (e.g., '*.txt', default: '*')",
-                                "default": "*"
-                            }
-                        },
-                        "required": ["path"]
-                    }
-                ),
-                
-                # Connection management
-                Tool(
-                    name="test_connection",
-                    description="Test connection to the Windows Remote Control service",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="get_status",
-                    description="Get status information about the connection",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="configure_connection",
-                    description="Configure the connection host and port",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "host": {
-                                "type": "string",
-                                "description": "Host to connect to (default: localhost)",
-                                "default": "localhost"
-                            },
-                            "port": {
-                                "type": "integer",
-                                "description": "Port to connect to (default: 8417)",
-                                "default": 8417
-                            }
-                        },
-                        "required": []
-                    }
-                )
-            ]
+            return _TOOLS
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
@@ -294,40 +365,12 @@ class WinRemoteMCPServer:
                 # Ensure client is initialized
                 await self._ensure_client_initialized()
                 
-                if name == "launch_browser":
-                    return await self._launch_browser(arguments)
-                elif name == "shell_start":
-                    return await self._shell_start(arguments)
-                elif name == "shell_stop":
-                    return await self._shell_stop(arguments)
-                elif name == "shell_status":
-                    return await self._shell_status(arguments)
-                elif name == "shell_command":
-                    return await self._shell_command(arguments)
-                elif name == "shell_get_output":
-                    return await self._shell_get_output(arguments)
-                elif name == "shell_cd":
-                    return await self._shell_cd(arguments)
-                elif name == "upload_file":
-                    return await self._upload_file(arguments)
-                elif name == "download_file":
-                    return await self._download_file(arguments)
-                elif name == "file_exists":
-                    return await self._file_exists(arguments)
-                elif name == "get_file_info":
-                    return await self._get_file_info(arguments)
-                elif name == "delete_file":
-                    return await self._delete_file(arguments)
-                elif name == "list_files":
-                    return await self._list_files(arguments)
-                elif name == "test_connection":
-                    return await self._test_connection(arguments)
-                elif name == "get_status":
-                    return await self._get_status(arguments)
-                elif name == "configure_connection":
-                    return await self._configure_connection(arguments)
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
+                if name in _COALESCED_TOOLS:
+                    return await self._call_coalesced(name, handler, arguments)
+                return await handler(arguments)
                     
             except Exception as e:
                 logger.error(f"Error in tool {name}: {e}")
@@ -336,16 +379,43 @@ class WinRemoteMCPServer:
     async def _ensure_client_initialized(self):
         """Ensure Remote Control client is initialized."""
         if self.client is None:
-            self.client = RemoteControlClient(host=self.host, port=self.port)
-            logger.info(f"Initialized Remote Control client for {self.host}:{self.port}")
+            async with self._init_lock:
+                if self.client is None:
+                    self.client = RemoteControlClient(host=self.host, port=self.port,
+                                                      cache_ttl=_PATH_CACHE_TTL)
+                    logger.info(f"Initialized Remote Control client for {self.host}:{self.port}")
+
+    async def _call_coalesced(self, name: str,
+                              handler: Callable[[Dict[str, Any]], Awaitable[Sequence[TextContent]]],
+                              arguments: Dict[str, Any]) -> Sequence[TextContent]:
+        """Run a read-only tool call, sharing the result with identical calls already in flight."""
+        key = (name, json.dumps(arguments, sort_keys=True, default=str))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(handler(arguments))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared task so one cancelled caller doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _cached_connection_call(self, key: str, func: Callable[[], Any]) -> Any:
+        """Call a connection check, reusing a result fetched within the last _CONNECTION_CACHE_TTL seconds."""
+        entry = self._connection_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _CONNECTION_CACHE_TTL:
+            return entry[1]
+        
+        value = await asyncio.to_thread(func)
+        self._connection_cache[key] = (time.monotonic(), value)
+        return value
 
     # Browser control methods
-    async def _launch_browser(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _launch_browser(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Launch browser with specified URL."""
         url = arguments["url"]
         
         try:
-            success = self.client.launch_browser(url)
+            success = await asyncio.to_thread(self.client.launch_browser, url)
             result = {
                 "success": success,
                 "url": url,
@@ -358,81 +428,90 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
     # Shell operation methods
-    async def _shell_start(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _shell_start(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Start a Windows shell session."""
         working_directory = arguments.get("working_directory")
         
         try:
-            success = self.client.start_shell(working_directory)
+            success = await asyncio.to_thread(self.client.start_shell, working_directory)
+            self._shell_running = success or None
             result = {
                 "success": success,
                 "working_directory": working_directory,
                 "message": f"Shell started successfully" + (f" in {working_directory}" if working_directory else "") if success else "Failed to start shell"
             }
         except Exception as e:
+            self._shell_running = None
             result = {
                 "success": False,
                 "working_directory": working_directory,
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _shell_stop(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _shell_stop(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Stop the current shell session."""
         try:
-            success = self.client.stop_shell()
+            success = await asyncio.to_thread(self.client.stop_shell)
+            self._shell_running = False if success else None
             result = {
                 "success": success,
                 "message": "Shell stopped successfully" if success else "Failed to stop shell"
             }
         except Exception as e:
+            self._shell_running = None
             result = {
                 "success": False,
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _shell_status(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _shell_status(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get shell status."""
         try:
-            is_running = self.client.get_shell_status()
+            is_running = await asyncio.to_thread(self.client.get_shell_status)
+            self._shell_running = is_running
             result = {
                 "running": is_running,
                 "status": "running" if is_running else "stopped"
             }
         except Exception as e:
+            self._shell_running = None
             result = {
                 "running": False,
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _shell_command(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _shell_command(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a shell command and get output."""
         command = arguments["command"]
         auto_start = arguments.get("auto_start", True)
         working_directory = arguments.get("working_directory")
         
         try:
-            # Start shell if requested and not running
-            if auto_start and not self.client.get_shell_status():
-                self.client.start_shell(working_directory)
-                await asyncio.sleep(0.1)  # Brief delay for shell to start
-            
-            # Send command
-            self.client.send_shell_input(command)
-            
-            # Wait a moment for command to execute
-            await asyncio.sleep(0.5)
-            
-            # Get output
-            output_result = self.client.get_shell_output()
+            try:
+                # Start (if needed), send and collect output in a single round-trip
+                output_result = await asyncio.to_thread(
+                    self.client.exec_command, command, working_directory, auto_start
+                )
+            except RuntimeError as e:
+                # Older tray apps don't know shell_exec; fall back to separate calls
+                if "Unknown action" not in str(e):
+                    raise
+                output_result = await self._shell_command_legacy(command, auto_start, working_directory)
+            if auto_start:
+                self._shell_running = True
             
             result = {
                 "command": command,
@@ -442,6 +521,7 @@ class WinRemoteMCPServer:
                 "error": output_result["error"]
             }
         except Exception as e:
+            self._shell_running = None
             result = {
                 "command": command,
                 "working_directory": working_directory,
@@ -449,31 +529,47 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _shell_get_output(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    async def _shell_command_legacy(self, command: str, auto_start: bool,
+                                    working_directory: Optional[str]) -> Dict[str, str]:
+        """Execute a shell command using separate start/input/output requests."""
+        # Start shell if requested and not running; skip the status check once it is known to be up
+        if auto_start and not self._shell_running:
+            if not await asyncio.to_thread(self.client.get_shell_status):
+                await asyncio.to_thread(self.client.start_shell, working_directory)
+                await asyncio.sleep(0.1)  # Brief delay for shell to start
+            self._shell_running = True
+        
+        # Send command
+        await asyncio.to_thread(self.client.send_shell_input, command)
+        
+        # Poll for output with exponential backoff, returning as soon as the shell responds
+        output_result = {"output": "", "error": ""}
+        for delay in _OUTPUT_POLL_DELAYS:
+            await asyncio.sleep(delay)
+            output_result = await asyncio.to_thread(self.client.get_shell_output)
+            if output_result["output"] or output_result["error"]:
+                break
+        return output_result
+
+    @_tool_response
+    async def _shell_get_output(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get pending shell output."""
-        try:
-            output_result = self.client.get_shell_output()
-            result = {
-                "success": True,
-                "output": output_result["output"],
-                "error": output_result["error"]
-            }
-        except Exception as e:
-            result = {
-                "success": False,
-                "error": str(e)
-            }
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        output_result = await asyncio.to_thread(self.client.get_shell_output)
+        return {
+            "success": True,
+            "output": output_result["output"],
+            "error": output_result["error"]
+        }
 
-    async def _shell_cd(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _shell_cd(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Change working directory of the running shell."""
         directory = arguments["directory"]
         
         try:
-            success = self.client.change_directory(directory)
+            success = await asyncio.to_thread(self.client.change_directory, directory)
             result = {
                 "success": success,
                 "directory": directory,
@@ -486,21 +582,23 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
     # File operation methods
-    async def _upload_file(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _upload_file(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Upload a file to Windows."""
         local_path = arguments["local_path"]
         remote_path = arguments["remote_path"]
         
         try:
-            success = self.client.upload_file(local_path, remote_path)
+            success = await asyncio.to_thread(self.client.upload_file, local_path, remote_path)
             
             # Get file size for info
-            file_size = 0
-            if os.path.exists(local_path):
-                file_size = os.path.getsize(local_path)
+            try:
+                file_size = os.stat(local_path).st_size
+            except OSError:
+                file_size = 0
             
             result = {
                 "success": success,
@@ -517,20 +615,24 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _download_file(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _download_file(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Download a file from Windows."""
         remote_path = arguments["remote_path"]
         local_path = arguments["local_path"]
         
         try:
-            success = self.client.download_file(remote_path, local_path)
+            success = await asyncio.to_thread(self.client.download_file, remote_path, local_path)
             
             # Get file size for info
             file_size = 0
-            if success and os.path.exists(local_path):
-                file_size = os.path.getsize(local_path)
+            if success:
+                try:
+                    file_size = os.stat(local_path).st_size
+                except OSError:
+                    pass
             
             result = {
                 "success": success,
@@ -547,14 +649,15 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _file_exists(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _file_exists(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Check if file exists on Windows."""
         path = arguments["path"]
         
         try:
-            exists = self.client.file_exists(path)
+            exists = await asyncio.to_thread(self.client.file_exists, path)
             result = {
                 "path": path,
                 "exists": exists
@@ -566,19 +669,26 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _get_file_info(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _get_file_info(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get file information from Windows."""
         path = arguments["path"]
         
         try:
-            file_info = self.client.get_file_info(path)
-            result = {
-                "path": path,
-                "exists": True,
-                "info": file_info
-            }
+            file_info = await asyncio.to_thread(self.client.get_file_info, path)
+            if file_info["exists"]:
+                result = {
+                    "path": path,
+                    "exists": True,
+                    "info": file_info
+                }
+            else:
+                result = {
+                    "path": path,
+                    "exists": False
+                }
         except Exception as e:
             result = {
                 "path": path,
@@ -586,18 +696,19 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _delete_file(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _delete_file(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Delete a file on Windows."""
         path = arguments["path"]
         
         try:
-            success = self.client.delete_file(path)
+            success = await asyncio.to_thread(self.client.delete_file, path)
             result = {
                 "path": path,
                 "success": success,
-                "message": f"Successfully deleted {path}" if success else "Delete failed"
+                "message": f"Successfully deleted {path}" if success else f"File not found: {path}"
             }
         except Exception as e:
             result = {
@@ -606,22 +717,22 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _list_files(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _list_files(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """List files in a Windows directory."""
         path = arguments["path"]
         pattern = arguments.get("pattern", "*")
         
         try:
-            files = self.client.list_files(path, pattern)
+            files = await asyncio.to_thread(self.client.list_files, path, pattern)
             result = {
                 "path": path,
                 "pattern": pattern,
                 "success": True,
                 "file_count": len(files),
-                "files": [os.path.basename(f) for f in files],
-                "full_paths": files
+                "files": [f.rpartition("\\")[2].rpartition("/")[2] for f in files]
             }
         except Exception as e:
             result = {
@@ -631,13 +742,14 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
     # Connection management methods
-    async def _test_connection(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _test_connection(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Test connection to Windows Remote Control service."""
         try:
-            connected = self.client.test_connection()
+            connected = await self._cached_connection_call("connection", self.client.test_connection)
             result = {
                 "host": self.host,
                 "port": self.port,
@@ -652,15 +764,24 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _get_status(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _get_status(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get connection status information."""
         try:
-            status = self.client.get_status()
+            status = await self._cached_connection_call("status", self.client.get_status)
+            if not status["connected"]:
+                shell_running = False
+            elif self._shell_running is not None:
+                # The shell tools keep this up to date, so skip the round-trip
+                shell_running = self._shell_running
+            else:
+                shell_running = await asyncio.to_thread(self.client.get_shell_status)
+                self._shell_running = shell_running
             result = {
                 "connection": status,
-                "shell_running": self.client.get_shell_status() if status["connected"] else False
+                "shell_running": shell_running
             }
         except Exception as e:
             result = {
@@ -674,9 +795,10 @@ class WinRemoteMCPServer:
                 "error": str(e)
             }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
-    async def _configure_connection(self, arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    @_tool_response
+    async def _configure_connection(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Configure connection settings."""
         host = arguments.get("host", self.host)
         port = arguments.get("port", self.port)
@@ -685,8 +807,12 @@ class WinRemoteMCPServer:
         self.host = host
         self.port = port
         
-        # Reinitialize client with new settings
-        self.client = RemoteControlClient(host=self.host, port=self.port)
+        # Reinitialize client with new settings, dropping the old client's pooled connections
+        if self.client is not None:
+            self.client.close()
+        self._shell_running = None
+        self._connection_cache.clear()
+        self.client = RemoteControlClient(host=self.host, port=self.port, cache_ttl=_PATH_CACHE_TTL)
         
         result = {
             "host": self.host,
@@ -694,7 +820,7 @@ class WinRemoteMCPServer:
             "message": f"Connection configured for {self.host}:{self.port}"
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
 
 async def main():
     """Main entry point for the MCP server."""
@@ -702,20 +828,31 @@ async def main():
     winremote_server = WinRemoteMCPServer()
     logger.info("Windows Remote Control MCP Server initialized with tools")
     
+    # Capabilities are fixed for the process; build them before the transport opens
+    init_options = InitializationOptions(
+        server_name="winremote-mcp-server",
+        server_version="1.0.0",
+        capabilities=winremote_server.server.get_capabilities(
+            notification_options=NotificationOptions(),
+            experimental_capabilities={},
+        ),
+    )
+    
     # Run the server using stdio transport
     async with stdio_server() as (read_stream, write_stream):
-        await winremote_server.server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="winremote-mcp-server",
-                server_version="1.0.0",
-                capabilities=winremote_server.server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            ),
-        )
+        await winremote_server.server.run(read_stream, write_stream, init_options)
+
+def _install_uvloop():
+    """Use uvloop for the event loop when it is available (POSIX only)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+    logger.info("Using uvloop event loop")
 
 if __name__ == "__main__":
+    _install_uvloop()
     asyncio.run(main())
\ No newline at end of file
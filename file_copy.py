@@ -9,7 +9,8 @@ using the Remote Control tray application. Supports both directions:
 
 Usage:
     python file_copy.py <source> <destination> [--host HOST] [--port PORT]
-    python file_copy.py --list remote:<directory> [--pattern PATTERN]
+    python file_copy.py <pattern|directory> <destination_dir> [--concurrency N]
+    python file_copy.py --list remote:<directory> [--pattern PATTERN] [--long]
     python file_copy.py --info remote:<file>
     python file_copy.py --delete remote:<file>
 
@@ -20,9 +21,18 @@ Examples:
     # Download file from remote  
     python file_copy.py remote:C:/temp/document.txt ./downloaded_document.txt
     
+    # Upload a directory, 8 files at a time
+    python file_copy.py ./reports remote:C:/temp/reports --concurrency 8
+    
+    # Download all matching remote files
+    python file_copy.py "remote:C:/temp/*.log" ./logs
+    
     # List remote files
     python file_copy.py --list remote:C:/temp/ --pattern "*.txt"
     
+    # List remote files with sizes and modification times
+    python file_copy.py --list remote:C:/temp/ --long
+    
     # Get file info
     python file_copy.py --info remote:C:/temp/document.txt
     
@@ -31,10 +41,11 @@ Examples:
 """
 
 import argparse
+import glob
 import sys
 import os
 import time
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from remote_control_client import RemoteControlClient
 
 
@@ -66,7 +77,8 @@ class FileCopyTool:
         else:
             return False, path
     
-    def copy_file(self, source: str, destination: str, verbose: bool = True) -> bool:
+    def copy_file(self, source: str, destination: str, verbose: bool = True, parallelism: int = 1,
+                  compress: bool = True, force: bool = False, resume: bool = False) -> bool:
         """
         Copy a file between local and remote locations.
         
@@ -74,6 +86,10 @@ class FileCopyTool:
             source: Source path (local or remote:path)
             destination: Destination path (local or remote:path)
             verbose: Whether to print progress messages
+            parallelism: Number of concurrent streams used to upload large files
+            compress: Whether uploads may be gzip-compressed in transit
+            force: Copy even if the destination already has identical contents
+            resume: Continue an interrupted upload from the partial file it left on the remote machine
             
         Returns:
             True if successful, False otherwise
@@ -88,30 +104,30 @@ class FileCopyTool:
         if verbose:
             print(f"Connecting to {self.client.host}:{self.client.port}...")
             
-        # Test connection
-        if not self.client.test_connection():
-            print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
-            return False
-            
         try:
             if src_is_remote:
                 # Download: remote -> local
                 if verbose:
                     print(f"Downloading {src_path} to {dst_path}...")
                     
-                # Check if remote file exists
-                if not self.client.file_exists(src_path):
+                # Check the remote file exists and get its size for progress
+                file_info = self.client.stat_file(src_path)
+                if not file_info["exists"]:
                     print(f"Error: Remote file not found: {src_path}", file=sys.stderr)
                     return False
                     
-                # Get file info for progress
                 if verbose:
-                    try:
-                        file_info = self.client.get_file_info(src_path)
-                        size_mb = file_info["size"] / (1024 * 1024)
-                        print(f"File size: {size_mb:.2f} MB")
-                    except:
-                        pass
+                    size_mb = file_info["size"] / (1024 * 1024)
+                    print(f"File size: {size_mb:.2f} MB")
+                    
+                # Only hash when the local copy's size already matches; the sizes are known, so
+                # the check costs a single hash request
+                if (not force and os.path.isfile(dst_path) and os.path.getsize(dst_path) == file_info["size"]
+                        and self.client.remote_file_matches(dst_path, src_path, local_size=file_info["size"],
+                                                            remote_size=file_info["size"])):
+                    if verbose:
+                        print("✓ Skipped, local file is identical")
+                    return True
                         
                 start_time = time.time()
                 success = self.client.download_file(src_path, dst_path)
@@ -130,21 +146,21 @@ class FileCopyTool:
                 if verbose:
                     print(f"Uploading {src_path} to {dst_path}...")
                     
-                # Check if local file exists
-                if not os.path.exists(src_path):
+                # Check the local file exists and get its size for progress in one stat call
+                try:
+                    src_stat = os.stat(src_path)
+                except FileNotFoundError:
                     print(f"Error: Local file not found: {src_path}", file=sys.stderr)
                     return False
                     
-                # Get file info for progress
                 if verbose:
-                    try:
-                        size_mb = os.path.getsize(src_path) / (1024 * 1024)
-                        print(f"File size: {size_mb:.2f} MB")
-                    except:
-                        pass
+                    size_mb = src_stat.st_size / (1024 * 1024)
+                    print(f"File size: {size_mb:.2f} MB")
                         
                 start_time = time.time()
-                success = self.client.upload_file(src_path, dst_path)
+                # upload_file skips the transfer itself when the remote file is identical
+                success = self.client.upload_file(src_path, dst_path, parallelism=parallelism,
+                                                  compress=compress, resume=resume, if_changed=not force)
                 elapsed = time.time() - start_time
                 
                 if success:
@@ -155,44 +171,69 @@ class FileCopyTool:
                     print("✗ Upload failed", file=sys.stderr)
                     return False
                     
+        except ConnectionError:
+            print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
+            return False
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
             return False
     
-    def list_files(self, remote_path: str, pattern: str = "*") -> bool:
+    def list_files(self, remote_path: str, pattern: str = "*", long: bool = False) -> bool:
         """
         List files in a remote directory.
         
         Args:
             remote_path: Remote directory path
             pattern: File pattern to match
+            long: Also show each file's size and modification time
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            if not self.client.test_connection():
-                print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
-                return False
-                
-            files = self.client.list_files(remote_path, pattern)
+            if long:
+                return self._list_files_long(remote_path, pattern)
             
-            if not files:
+            # Print entries as the server streams them rather than waiting for the whole listing
+            count = 0
+            for file_path in self.client.iter_files(remote_path, pattern):
+                if count == 0:
+                    print(f"Files in remote:{remote_path} (pattern: {pattern}):")
+                filename = file_path.rpartition("\\")[2].rpartition("/")[2]
+                print(f"  {filename}")
+                count += 1
+                
+            if count == 0:
                 print("No files found")
                 return True
                 
-            print(f"Files in remote:{remote_path} (pattern: {pattern}):")
-            for file_path in files:
-                filename = os.path.basename(file_path)
-                print(f"  {filename}")
-                
-            print(f"\nTotal: {len(files)} files")
+            print(f"\nTotal: {count} files")
             return True
             
+        except ConnectionError:
+            print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
+            return False
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
             return False
     
+    def _list_files_long(self, remote_path: str, pattern: str) -> bool:
+        """List files with size and modification time, fetched in a single request."""
+        files = self.client.list_files_detailed(remote_path, pattern)
+        if not files:
+            print("No files found")
+            return True
+            
+        print(f"Files in remote:{remote_path} (pattern: {pattern}):")
+        total_size = 0
+        for info in files:
+            size = info.get("size", 0)
+            total_size += size
+            print(f"  {size:>12,}  {info.get('modified', '')}  {info.get('name', '')}")
+            
+        print(f"\nTotal: {len(files)} files, {total_size:,} bytes")
+        return True
+    
     def get_file_info(self, remote_path: str) -> bool:
         """
         Get information about a remote file.
@@ -204,15 +245,10 @@ class FileCopyTool:
             True if successful, False otherwise
         """
         try:
-            if not self.client.test_connection():
-                print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
-                return False
-                
-            if not self.client.file_exists(remote_path):
+            file_info = self.client.get_file_info(remote_path)
+            if not file_info["exists"]:
                 print(f"Error: Remote file not found: {remote_path}", file=sys.stderr)
                 return False
-                
-            file_info = self.client.get_file_info(remote_path)
             
             size_mb = file_info["size"] / (1024 * 1024)
             
@@ -225,10 +261,141 @@ class FileCopyTool:
             
             return True
             
+        except ConnectionError:
+            print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
+            return False
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
             return False
     
+    def is_multi_file_source(self, source: str) -> bool:
+        """
+        Check whether a source refers to several files (a wildcard pattern or a local directory).
+        
+        Args:
+            source: Source path (local or remote:path)
+            
+        Returns:
+            True if the source should be copied with copy_files
+        """
+        is_remote, path = self.parse_path(source)
+        if "*" in path or "?" in path:
+            return True
+        return not is_remote and os.path.isdir(path)
+    
+    def _expand_copy_pairs(self, source: str, destination: str) -> List[Tuple[str, str]]:
+        """
+        Expand a multi-file source into (source, destination) path pairs.
+        
+        Args:
+            source: Local directory or glob pattern, or remote:path wildcard pattern
+            destination: Destination directory (local or remote:path)
+            
+        Returns:
+            List of (source_path, destination_path) tuples without remote: prefixes
+        """
+        src_is_remote, src_path = self.parse_path(source)
+        _, dst_dir = self.parse_path(destination)
+        
+        pairs = []
+        if src_is_remote:
+            # Let the server match the pattern within its directory
+            directory, _, pattern = src_path.replace("\\", "/").rpartition("/")
+            for remote_file in self.client.iter_files(directory or ".", pattern):
+                filename = remote_file.rpartition("\\")[2].rpartition("/")[2]
+                pairs.append((remote_file, os.path.join(dst_dir, filename)))
+        elif os.path.isdir(src_path):
+            for root, _, files in os.walk(src_path):
+                for filename in files:
+                    local_file = os.path.join(root, filename)
+                    relative = os.path.relpath(local_file, src_path).replace(os.sep, "/")
+                    pairs.append((local_file, dst_dir.rstrip("/\\") + "/" + relative))
+        else:
+            for local_file in glob.glob(src_path):
+                if os.path.isfile(local_file):
+                    pairs.append((local_file, dst_dir.rstrip("/\\") + "/" + os.path.basename(local_file)))
+        return pairs
+    
+    def copy_files(self, source: str, destination: str, concurrency: int = 4, verbose: bool = True,
+                   compress: bool = True, force: bool = False, resume: bool = False) -> bool:
+        """
+        Copy several files between local and remote locations in parallel.
+        
+        Args:
+            source: Local directory or glob pattern, or remote:path wildcard pattern
+            destination: Destination directory (local or remote:path)
+            concurrency: Maximum number of files transferred at once
+            verbose: Whether to print progress messages
+            compress: Whether uploads may be gzip-compressed in transit
+            force: Copy files even if the destination already has identical contents
+            resume: Continue interrupted uploads from the partial files they left on the remote machine
+            
+        Returns:
+            True if every file was copied, False otherwise
+        """
+        src_is_remote, _ = self.parse_path(source)
+        dst_is_remote, _ = self.parse_path(destination)
+        
+        if src_is_remote == dst_is_remote:
+            print("Error: One path must be local and one must be remote", file=sys.stderr)
+            return False
+            
+        try:
+            pairs = self._expand_copy_pairs(source, destination)
+        except ConnectionError:
+            print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
+            return False
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return False
+            
+        if not pairs:
+            print(f"Error: No files match {source}", file=sys.stderr)
+            return False
+            
+        # Imported here to keep it off the startup path of single-file operations
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        def transfer(src: str, dst: str) -> bool:
+            if src_is_remote:
+                if not force and os.path.isfile(dst) and self.client.remote_file_matches(dst, src):
+                    return True
+                return self.client.download_file(src, dst)
+            return self.client.upload_file(src, dst, compress=compress, resume=resume, if_changed=not force)
+        
+        def copy_one(pair: Tuple[str, str]) -> int:
+            src, dst = pair
+            if not transfer(src, dst):
+                raise RuntimeError("Transfer failed")
+            return os.path.getsize(dst if src_is_remote else src)
+        
+        if verbose:
+            print(f"Copying {len(pairs)} files with concurrency {concurrency}...")
+            
+        start_time = time.time()
+        total_bytes = 0
+        failures = 0
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {executor.submit(copy_one, pair): pair for pair in pairs}
+            for future in as_completed(futures):
+                src, dst = futures[future]
+                try:
+                    total_bytes += future.result()
+                    if verbose:
+                        print(f"✓ {src} -> {dst}")
+                except Exception as e:
+                    failures += 1
+                    print(f"✗ {src}: {e}", file=sys.stderr)
+        elapsed = time.time() - start_time
+        
+        if verbose:
+            size_mb = total_bytes / (1024 * 1024)
+            rate = size_mb / elapsed if elapsed > 0 else 0.0
+            print(f"Copied {len(pairs) - failures}/{len(pairs)} files ({size_mb:.2f} MB) "
+                  f"in {elapsed:.2f} seconds ({rate:.2f} MB/s)")
+            
+        return failures == 0
+    
     def delete_file(self, remote_path: str) -> bool:
         """
         Delete a remote file.
@@ -240,14 +407,6 @@ class FileCopyTool:
             True if successful, False otherwise
         """
         try:
-            if not self.client.test_connection():
-                print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
-                return False
-                
-            if not self.client.file_exists(remote_path):
-                print(f"Error: Remote file not found: {remote_path}", file=sys.stderr)
-                return False
-                
             print(f"Deleting remote:{remote_path}...")
             success = self.client.delete_file(remote_path)
             
@@ -255,9 +414,12 @@ class FileCopyTool:
                 print("✓ File deleted successfully")
                 return True
             else:
-                print("✗ Delete failed", file=sys.stderr)
+                print(f"Error: Remote file not found: {remote_path}", file=sys.stderr)
                 return False
                 
+        except ConnectionError:
+            print(f"Error: Cannot connect to {self.client.host}:{self.client.port}", file=sys.stderr)
+            return False
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
             return False
@@ -272,6 +434,8 @@ def main():
 Examples:
   %(prog)s document.txt remote:C:/temp/document.txt    # Upload
   %(prog)s remote:C:/temp/doc.txt ./downloaded.txt     # Download
+  %(prog)s ./reports remote:C:/temp/reports -c 8       # Upload a directory
+  %(prog)s "remote:C:/temp/*.log" ./logs               # Download matching files
   %(prog)s --list remote:C:/temp/                      # List files
   %(prog)s --info remote:C:/temp/document.txt          # File info
   %(prog)s --delete remote:C:/temp/document.txt        # Delete file
@@ -315,6 +479,12 @@ Examples:
         help="File pattern for listing (default: *)"
     )
     
+    parser.add_argument(
+        "--long",
+        action="store_true",
+        help="Show size and modification time when listing"
+    )
+    
     parser.add_argument(
         "--info", "-i",
         metavar="PATH",
@@ -327,6 +497,38 @@ Examples:
         help="Delete remote file (remote:path)"
     )
     
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=4,
+        help="Files transferred in parallel when copying a pattern or directory (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--parallelism", "-P",
+        type=int,
+        default=1,
+        help="Upload a large file as this many concurrent byte ranges (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Upload files uncompressed (by default compressible files are gzipped in transit)"
+    )
+    
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Copy even if the destination already has identical contents"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted upload instead of sending the whole file again"
+    )
+    
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
@@ -355,7 +557,7 @@ Examples:
             if not args.list.startswith("remote:"):
                 parser.error("List path must be in format remote:path")
             _, remote_path = tool.parse_path(args.list)
-            success = tool.list_files(remote_path, args.pattern)
+            success = tool.list_files(remote_path, args.pattern, long=args.long)
             
         elif args.info:
             # Validate remote path
@@ -373,7 +575,15 @@ Examples:
             
         else:
             # Copy operation
-            success = tool.copy_file(args.source, args.destination, verbose=not args.quiet)
+            if tool.is_multi_file_source(args.source):
+                success = tool.copy_files(args.source, args.destination,
+                                          concurrency=args.concurrency, verbose=not args.quiet,
+                                          compress=not args.no_compress, force=args.force,
+                                          resume=args.resume)
+            else:
+                success = tool.copy_file(args.source, args.destination, verbose=not args.quiet,
+                                         parallelism=args.parallelism, compress=not args.no_compress,
+                                         force=args.force, resume=args.resume)
             
         sys.exit(0 if success else 1)
         
@@ -383,6 +593,8 @@ Examples:
     except Exception as e:
         print(f"Fatal error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        tool.client.close()
 
 
 if __name__ == "__main__":
@@ -5,32 +5,352 @@ This module provides an API to communicate with the Remote Control Windows tray
 via HTTP JSON protocol. Designed to work through SSH tunnels.
 """
 
+import base64
+import contextlib
+import copy
+import functools
+import http.client
 import json
-import urllib.request
-import urllib.error
-from typing import Dict, Any, Optional
+import ntpath
+import threading
+import time
+import urllib.parse
+from typing import BinaryIO, Callable, Dict, Any, Iterator, List, Optional, Tuple, Union
 import socket
-import base64
 import os
+import stat
 import hashlib
+import zlib
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Buffer size used when streaming file data to and from the socket
+TRANSFER_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of idle keep-alive connections kept open per client
+MAX_IDLE_CONNECTIONS = 4
+
+# How long (seconds) a successful probe or request lets test_connection skip probing again
+CONNECTION_PROBE_TTL = 1.0
+
+# Connect timeout (seconds) for test_connection, so an unreachable host fails fast. Through an
+# SSH tunnel the connect completes at the local forwarding listener, so a slow tunnel doesn't
+# delay it; the timeout only bounds direct connections to the machine.
+CONNECTION_PROBE_TIMEOUT = 2.0
+
+# Maximum number of query results kept by a client's cache (see cache_ttl)
+MAX_CACHE_ENTRIES = 2048
+
+# Suffix of the file the server writes a whole-file upload to before moving it over the target.
+# An interrupted upload leaves it behind, and resume continues from it.
+PARTIAL_UPLOAD_SUFFIX = ".partial"
+
+# Files smaller than this are always uploaded in a single request
+PARALLEL_UPLOAD_MIN_SIZE = 8 * 1024 * 1024
+
+# Files smaller than this, or with these (already compressed) extensions, are uploaded uncompressed
+COMPRESS_MIN_SIZE = 64 * 1024
+INCOMPRESSIBLE_EXTENSIONS = frozenset({
+    ".7z", ".avi", ".bz2", ".docx", ".gif", ".gz", ".jar", ".jpeg", ".jpg", ".mkv", ".mov", ".mp3",
+    ".mp4", ".png", ".pptx", ".rar", ".tgz", ".webp", ".whl", ".xlsx", ".xz", ".zip", ".zst",
+})
+
+# JSON request and response bodies smaller than this are sent uncompressed
+JSON_COMPRESS_MIN_SIZE = 4 * 1024
+
+# Headers of JSON requests, built once rather than per request
+_JSON_HEADERS = {
+    'Content-Type': 'application/json; charset=utf-8',
+    'Accept-Encoding': 'gzip'
+}
+_GZIP_JSON_HEADERS = {**_JSON_HEADERS, 'Content-Encoding': 'gzip'}
+
+# Actions that don't modify files on the remote machine, so a batch of them leaves the cache valid
+_READ_ONLY_ACTIONS = frozenset({
+    "file_exists", "file_info", "file_stat", "file_list", "file_list_detail", "shell_status", "shell_output"
+})
+
+# Backoff (in seconds) before each attempt to resume an interrupted upload
+UPLOAD_RETRY_DELAYS = (0.5, 1.0, 2.0)
+
+# Errors showing that a reused keep-alive connection had already been closed by the server,
+# so the request never reached it (ConnectionResetError includes http.client.RemoteDisconnected)
+_STALE_CONNECTION_ERRORS = (BrokenPipeError, ConnectionResetError)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # The server's parser doesn't decode \uXXXX escapes, so keep non-ASCII characters as UTF-8
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a UTF-8 JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _cache_path(remote_path: str) -> str:
+    """Return the form of a Windows path used in cache keys, so that spellings of the same file match."""
+    return ntpath.normcase(ntpath.normpath(remote_path))
+
+
+def _sha256_base64(local_path: str, length: Optional[int] = None) -> str:
+    """Return the Base64 SHA-256 of a local file, in the format the server reports hashes.
+    
+    If length is given, only that many bytes from the start of the file are hashed.
+    """
+    with open(local_path, 'rb') as f:
+        if length is None and hasattr(hashlib, "file_digest"):  # Python 3.11+
+            digest = hashlib.file_digest(f, "sha256")
+        else:
+            digest = hashlib.sha256()
+            remaining = os.fstat(f.fileno()).st_size if length is None else length
+            while remaining > 0:
+                block = f.read(min(TRANSFER_CHUNK_SIZE, remaining))
+                if not block:
+                    break
+                digest.update(block)
+                remaining -= len(block)
+    return base64.b64encode(digest.digest()).decode('ascii')
+
+
+class _ConnectError(ConnectionError):
+    """No connection to the server could be opened, so nothing was sent."""
+
+
+class _FileRange:
+    """Byte range of an open binary file, sent as a request body."""
+    
+    def __init__(self, f: BinaryIO, offset: int, length: int):
+        self._file = f
+        self._end = offset + length
+        f.seek(offset)
+    
+    def sendfile(self, sock: socket.socket):
+        """Send the rest of the range with socket.sendfile, letting the kernel copy the data where supported."""
+        position = self._file.tell()
+        if position < self._end:
+            sock.sendfile(self._file, position, self._end - position)
+    
+    def tell(self) -> int:
+        return self._file.tell()
+    
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+
+class _GzipFileBody:
+    """Gzip-compressed contents of an open binary file, sent as a chunked request body.
+    
+    The uncompressed bytes are hashed as they are read, so once the body has been sent
+    `digest` holds the file's SHA-256 without a second pass over it. Iterating restarts
+    from the beginning of the file, so the request can be resent.
+    """
+    
+    def __init__(self, f: BinaryIO):
+        self._file = f
+        self.digest = hashlib.sha256()
+    
+    def __iter__(self) -> Iterator[bytes]:
+        self._file.seek(0)
+        self.digest = hashlib.sha256()
+        compressor = zlib.compressobj(zlib.Z_BEST_SPEED, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+        for block in iter(lambda: self._file.read(TRANSFER_CHUNK_SIZE), b""):
+            self.digest.update(block)
+            data = compressor.compress(block)
+            if data:
+                yield data
+        yield compressor.flush()
 
 
 class RemoteControlClient:
     """Client for communicating with Remote Control tray application."""
     
-    def __init__(self, host: str = "localhost", port: int = 8417):
+    def __init__(self, host: str = "localhost", port: int = 8417, cache_ttl: float = 0.0):
         """
         Initialize the Remote Control client.
         
         Args:
             host: The hostname to connect to (default: localhost)
             port: The port to connect to (default: 8417)
+            cache_ttl: Seconds to reuse results of file_exists, get_file_info, stat_file,
+                list_files and list_files_detailed (default: 0, no caching). Results are
+                invalidated by uploads, deletes and shell commands sent through this client,
+                but not by changes made on the remote machine by anything else.
         """
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}/"
+        self.cache_ttl = cache_ttl
+        
+        # Idle keep-alive connections, reused across requests and threads
+        self._idle_connections: List[http.client.HTTPConnection] = []
+        self._pool_lock = threading.Lock()
+        # Monotonic time of the last successful probe or request
+        self._last_connected_at = 0.0
+        # (family, sockaddr) of the server, resolved on the first probe
+        self._probe_address: Optional[Tuple[int, Any]] = None
+        # Query results keyed by (kind, path, ...) -> (expiry time, value), least recently used first
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Bumped by invalidate, so a fetch that started before it doesn't store a stale result
+        self._cache_generation = 0
+    
+    def close(self):
+        """Close any idle keep-alive connections held by the client."""
+        with self._pool_lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for conn in connections:
+            conn.close()
+    
+    def invalidate(self, remote_path: Optional[str] = None):
+        """
+        Drop cached query results.
+        
+        Args:
+            remote_path: Only drop results for this file, and all directory listings.
+                If omitted, the whole cache is cleared.
+        """
+        with self._cache_lock:
+            self._cache_generation += 1
+            if remote_path is None:
+                self._cache.clear()
+                return
+            path = _cache_path(remote_path)
+            for key in [key for key in self._cache if key[1] == path or key[0].startswith("list")]:
+                del self._cache[key]
     
-    def _make_request(self, data: Dict[str, Any], timeout: int = 10) -> Dict[str, Any]:
+    def _cached(self, key: Tuple, func: Callable[[], Any]) -> Any:
+        """Return func()'s result, reusing it for cache_ttl seconds.
+        
+        key is (kind, remote_path, ...); the path is normalised before use.
+        """
+        if self.cache_ttl <= 0:
+            return func()
+            
+        key = (key[0], _cache_path(key[1])) + key[2:]
+        now = time.monotonic()
+        with self._cache_lock:
+            generation = self._cache_generation
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._cache.move_to_end(key)
+                else:
+                    del self._cache[key]
+                    entry = None
+        if entry is None:
+            entry = (now + self.cache_ttl, func())
+            with self._cache_lock:
+                if self._cache_generation != generation:
+                    # Invalidated while fetching, so the result may predate the change; don't keep it
+                    return entry[1]
+                self._cache[key] = entry
+                self._cache.move_to_end(key)
+                while len(self._cache) > MAX_CACHE_ENTRIES:
+                    self._cache.popitem(last=False)
+        # Deep copy so callers can't modify the cached value or the entries nested in it
+        value = entry[1]
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+    
+    def __enter__(self) -> "RemoteControlClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _acquire_connection(self, fresh: bool = False) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return an idle pooled connection, or a new one, plus whether it was reused.
+        
+        With fresh set, always return a new connection.
+        """
+        with self._pool_lock:
+            if self._idle_connections and not fresh:
+                return self._idle_connections.pop(), True
+        return http.client.HTTPConnection(self.host, self.port, blocksize=TRANSFER_CHUNK_SIZE), False
+    
+    def _release_connection(self, conn: http.client.HTTPConnection):
+        """Return a connection to the idle pool once its response has been fully read."""
+        with self._pool_lock:
+            if len(self._idle_connections) < MAX_IDLE_CONNECTIONS:
+                self._idle_connections.append(conn)
+                return
+        conn.close()
+    
+    @contextlib.contextmanager
+    def _request(self, method: str, path: str, body: Union[bytes, BinaryIO, None] = None,
+                 headers: Optional[Dict[str, str]] = None,
+                 timeout: float = 10) -> Iterator[http.client.HTTPResponse]:
+        """
+        Send an HTTP request on a keep-alive connection and yield the response.
+        
+        A request that finds a reused connection already closed by the server (while
+        sending, or before any response arrives) is retried once on a fresh connection.
+        Other failures, including timeouts, are not retried, since the server may
+        already have run the request.
+        
+        Raises:
+            ConnectionError: If unable to connect to server
+        """
+        body_start = body.tell() if hasattr(body, "tell") else None
+        retried = False
+        while True:
+            conn, reused = self._acquire_connection(fresh=retried)
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            else:
+                try:
+                    conn.connect()
+                except OSError as e:
+                    conn.close()
+                    raise _ConnectError(f"Unable to connect to {self.host}:{self.port}") from e
+            try:
+                if isinstance(body, _FileRange):
+                    conn.putrequest(method, path)
+                    for name, value in (headers or {}).items():
+                        conn.putheader(name, value)
+                    conn.endheaders()
+                    body.sendfile(conn.sock)
+                else:
+                    conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                self._last_connected_at = time.monotonic()
+                break
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if reused and not retried:
+                    retried = True
+                    if body_start is not None:
+                        body.seek(body_start)
+                    continue
+                raise ConnectionError(f"HTTP request failed: {e}") from e
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                raise ConnectionError(f"HTTP request failed: {e}") from e
+        
+        try:
+            yield response
+            # Drain anything the caller didn't read so the connection can be reused
+            response.read()
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._release_connection(conn)
+    
+    def _make_request(self, data: Dict[str, Any], timeout: float = 10) -> Dict[str, Any]:
         """
         Make an HTTP POST request to the remote control server.
         
@@ -47,24 +367,116 @@ class RemoteControlClient:
             RuntimeError: If server returns an error response
         """
         try:
-            json_data = json.dumps(data).encode('utf-8')
-            
-            req = urllib.request.Request(
-                self.base_url,
-                data=json_data,
-                headers={'Content-Type': 'application/json'}
-            )
+            json_data = _dumps(data)
+            headers = _JSON_HEADERS
+            if len(json_data) >= JSON_COMPRESS_MIN_SIZE:
+                compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+                json_data = compressor.compress(json_data) + compressor.flush()
+                headers = _GZIP_JSON_HEADERS
             
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                response_data = response.read().decode('utf-8')
-                return json.loads(response_data)
+            with self._request("POST", "/", body=json_data, headers=headers, timeout=timeout) as response:
+                response_data = response.read()
+                if response.status >= 400:
+                    raise ConnectionError(f"HTTP request failed: HTTP Error {response.status}: {response.reason}")
+                if response.getheader('Content-Encoding') == 'gzip':
+                    response_data = zlib.decompress(response_data, 31)
+                return _loads(response_data)
                 
-        except urllib.error.URLError as e:
-            if isinstance(e.reason, socket.error):
-                raise ConnectionError(f"Unable to connect to {self.host}:{self.port}") from e
+        except ConnectionError:
+            raise
+        except (http.client.HTTPException, OSError) as e:
             raise ConnectionError(f"HTTP request failed: {e}") from e
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON response from server: {e}") from e
+        except zlib.error as e:
+            raise ValueError(f"Invalid compressed response from server: {e}") from e
+    
+    def _call(self, action: str, timeout: float = 10, **params) -> Dict[str, Any]:
+        """
+        Perform a server action and return its response.
+        
+        Args:
+            action: Name of the server action
+            timeout: Request timeout in seconds
+            **params: Additional fields of the request
+            
+        Returns:
+            JSON response as dictionary
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            ValueError: If server returns invalid JSON
+            RuntimeError: If server returns an error
+        """
+        response = self._make_request({"action": action, **params}, timeout=timeout)
+        if not response.get("success"):
+            raise RuntimeError(f"Server error: {response.get('error', 'Unknown error')}")
+        return response
+    
+    @staticmethod
+    def _file_info(response: Dict[str, Any], include_hash: bool) -> Dict[str, Any]:
+        """Convert a file_info or file_stat response into the dictionary returned to callers."""
+        if not response.get("exists", True):
+            return {"exists": False}
+        info = {
+            "exists": True,
+            "name": response.get("name", ""),
+            "fullName": response.get("fullName", ""),
+            "size": response.get("size", 0),
+            "created": response.get("created", ""),
+            "modified": response.get("modified", "")
+        }
+        if include_hash:
+            info["hash"] = response.get("hash", "")
+        return info
+    
+    @contextlib.contextmanager
+    def _file_transfer(self, method: str, remote_path: str, body: Optional[BinaryIO] = None,
+                       headers: Optional[Dict[str, str]] = None,
+                       query: Optional[Dict[str, Any]] = None,
+                       timeout: float = 120) -> Iterator[http.client.HTTPResponse]:
+        """
+        Send a request to the binary file transfer endpoint and yield the response.
+        
+        Args:
+            method: "GET" to download or "POST" to upload
+            remote_path: Path to the file on the remote machine
+            body: File object to stream as the request body (uploads only)
+            headers: Extra request headers
+            query: Extra query string parameters
+            timeout: Request timeout in seconds
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error response
+        """
+        path = f"/file?path={urllib.parse.quote(remote_path)}"
+        if query:
+            path += "&" + urllib.parse.urlencode(query)
+        try:
+            with self._request(method, path, body=body, headers=headers, timeout=timeout) as response:
+                self._check_response(response)
+                yield response
+        finally:
+            # Even a failed upload may have changed the remote file or its partial file
+            if method == "POST":
+                self.invalidate(remote_path)
+                self.invalidate(remote_path + PARTIAL_UPLOAD_SUFFIX)
+    
+    @staticmethod
+    def _check_response(response: http.client.HTTPResponse):
+        """
+        Raise the server's JSON error message for an HTTP error status.
+        
+        Raises:
+            RuntimeError: If the response has an error status
+        """
+        if response.status >= 400:
+            try:
+                error_msg = _loads(response.read()).get("error", "Unknown error")
+            except ValueError:
+                error_msg = f"HTTP {response.status}"
+            raise RuntimeError(f"Server error: {error_msg}")
     
     def launch_browser(self, url: str) -> bool:
         """
@@ -84,24 +496,8 @@ class RemoteControlClient:
         if not url or not url.strip():
             raise ValueError("URL cannot be empty")
             
-        data = {
-            "action": "launch_browser",
-            "url": url.strip()
-        }
-        
-        try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return True
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        self._call("launch_browser", url=url.strip())
+        return True
     
     def test_connection(self) -> bool:
         """
@@ -110,14 +506,26 @@ class RemoteControlClient:
         Returns:
             True if server is reachable, False otherwise
         """
+        # The server answered very recently; skip the probe
+        if time.monotonic() - self._last_connected_at < CONNECTION_PROBE_TTL:
+            return True
+        
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex((self.host, self.port))
+            if self._probe_address is None:
+                # Resolve once rather than on every probe
+                family, _, _, _, sockaddr = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)[0]
+                self._probe_address = (family, sockaddr)
+            family, sockaddr = self._probe_address
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.settimeout(CONNECTION_PROBE_TIMEOUT)
+            result = sock.connect_ex(sockaddr)
             sock.close()
-            return result == 0
         except Exception:
             return False
+        
+        if result == 0:
+            self._last_connected_at = time.monotonic()
+        return result == 0
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -148,23 +556,9 @@ class RemoteControlClient:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {"action": "shell_start"}
-        if working_directory:
-            data["working_directory"] = working_directory
-        
-        try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return True
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        params = {"working_directory": working_directory} if working_directory else {}
+        self._call("shell_start", **params)
+        return True
     
     def send_shell_input(self, command: str) -> bool:
         """
@@ -184,29 +578,19 @@ class RemoteControlClient:
         if not command or not command.strip():
             raise ValueError("Command cannot be empty")
             
-        data = {
-            "action": "shell_input",
-            "input": command.strip()
-        }
-        
-        try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return True
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        self._call("shell_input", input=command.strip())
+        # The command may change files
+        self.invalidate()
+        return True
     
-    def get_shell_output(self) -> Dict[str, str]:
+    def get_shell_output(self, wait_ms: int = 0) -> Dict[str, str]:
         """
         Get output from the running shell.
         
+        Args:
+            wait_ms: If no output is pending, wait up to this many milliseconds on the
+                server for some to arrive (default: 0, return immediately)
+        
         Returns:
             Dictionary with 'output' and 'error' keys containing shell output
             
@@ -214,25 +598,89 @@ class RemoteControlClient:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {"action": "shell_output"}
+        if wait_ms > 0:
+            # Allow the HTTP request to outlive the server-side wait
+            response = self._call("shell_output", timeout=wait_ms / 1000 + 10, wait_ms=wait_ms)
+        else:
+            response = self._call("shell_output")
+        return {
+            "output": response.get("output", ""),
+            "error": response.get("error", "")
+        }
+    
+    def iter_shell_output(self, min_interval: float = 0.05, max_interval: float = 1.0,
+                          wait_ms: int = 0) -> Iterator[Dict[str, str]]:
+        """
+        Yield output from the running shell as it arrives.
         
-        try:
-            response = self._make_request(data)
+        While the shell is quiet the polling interval doubles, up to max_interval, and it
+        drops back to min_interval as soon as output arrives. With wait_ms set, each poll
+        instead waits on the server for output, so an idle shell costs one request per
+        wait_ms; an empty reply that comes back much sooner falls back to the polling backoff.
+        The generator runs until the caller stops iterating.
+        
+        Args:
+            min_interval: Seconds between polls while output is arriving
+            max_interval: Longest interval between polls while the shell is quiet
+            wait_ms: Milliseconds each poll waits on the server for output (default: 0, poll)
             
-            if response.get("success"):
-                return {
-                    "output": response.get("output", ""),
-                    "error": response.get("error", "")
-                }
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        Yields:
+            Dictionaries with 'output' and 'error' keys, only when either is non-empty
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error
+        """
+        delay = min_interval
+        while True:
+            started = time.monotonic()
+            result = self.get_shell_output(wait_ms=wait_ms)
+            if result["output"] or result["error"]:
+                delay = min_interval
+                yield result
+            elif wait_ms <= 0 or time.monotonic() - started < wait_ms / 2000:
+                # Polling, or the server returned well before wait_ms (e.g. an older server that
+                # ignores it), so back off here rather than re-requesting at once
+                time.sleep(delay)
+                delay = min(delay * 2, max_interval)
     
+    def exec_command(self, command: str, working_directory: Optional[str] = None,
+                     auto_start: bool = True, timeout_ms: int = 5000) -> Dict[str, Any]:
+        """
+        Run a command in the shell and wait for its output in a single request.
+
+        The server starts the shell if needed, sends the command, and collects
+        output until the shell goes quiet or the timeout expires.
+
+        Args:
+            command: The command to send to the shell
+            working_directory: Directory to start the shell in if it is not running (optional)
+            auto_start: Whether to start the shell if it is not running (default: True)
+            timeout_ms: Maximum time to wait for output in milliseconds (default: 5000)
+
+        Returns:
+            Dictionary with 'output', 'error' and 'timed_out' keys
+
+        Raises:
+            ConnectionError: If unable to connect to server
+            ValueError: If command is empty
+            RuntimeError: If server returns an error
+        """
+        if not command or not command.strip():
+            raise ValueError("Command cannot be empty")
+
+        params = {"working_directory": working_directory} if working_directory else {}
+        # Allow the HTTP request to outlive the server-side wait
+        response = self._call("shell_exec", timeout=timeout_ms / 1000 + 10, input=command.strip(),
+                              auto_start=auto_start, timeout_ms=timeout_ms, **params)
+        # The command may change files
+        self.invalidate()
+        return {
+            "output": response.get("output", ""),
+            "error": response.get("error", ""),
+            "timed_out": response.get("timed_out", False)
+        }
+
     def stop_shell(self) -> bool:
         """
         Stop the running shell process.
@@ -244,21 +692,8 @@ class RemoteControlClient:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {"action": "shell_stop"}
-        
-        try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return True
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        self._call("shell_stop")
+        return True
     
     def get_shell_status(self) -> bool:
         """
@@ -271,21 +706,7 @@ class RemoteControlClient:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {"action": "shell_status"}
-        
-        try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return response.get("running", False)
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        return self._call("shell_status").get("running", False)
     
     def change_directory(self, directory: str) -> bool:
         """
@@ -305,32 +726,29 @@ class RemoteControlClient:
         if not directory or not directory.strip():
             raise ValueError("Directory cannot be empty")
             
-        data = {
-            "action": "shell_cd",
-            "directory": directory.strip()
-        }
-        
-        try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return True
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        self._call("shell_cd", directory=directory.strip())
+        return True
     
-    def upload_file(self, local_path: str, remote_path: str) -> bool:
+    def upload_file(self, local_path: str, remote_path: str, parallelism: int = 1,
+                    compress: bool = True, resume: bool = False, if_changed: bool = False) -> bool:
         """
         Upload a local file to the remote Windows machine.
         
+        If the connection drops part way through a single-stream upload, the upload is
+        resumed from the bytes the server already received (see UPLOAD_RETRY_DELAYS).
+        
         Args:
             local_path: Path to the local file to upload
             remote_path: Path where the file should be saved on the remote machine
+            parallelism: Number of byte ranges to upload concurrently on separate
+                connections. Only used for files of at least PARALLEL_UPLOAD_MIN_SIZE.
+            compress: Gzip the file in transit unless it is small or has the extension
+                of an already-compressed format. Not used for parallel uploads.
+            resume: If an earlier interrupted upload left a partial file that matches the
+                start of the local file, send only the remaining bytes.
+            if_changed: Skip the upload if the remote file already has the same contents
+                (see remote_file_matches), so an unchanged file costs a stat request, or a
+                hash comparison if the sizes match, instead of a transfer.
             
         Returns:
             True if successful, False otherwise
@@ -340,34 +758,70 @@ class RemoteControlClient:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        if not os.path.exists(local_path):
-            raise FileNotFoundError(f"Local file not found: {local_path}")
+        try:
+            local_stat = os.stat(local_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Local file not found: {local_path}") from None
             
-        if not os.path.isfile(local_path):
+        if not stat.S_ISREG(local_stat.st_mode):
             raise ValueError(f"Path is not a file: {local_path}")
             
         # Check file size (100MB limit)
-        file_size = os.path.getsize(local_path)
+        file_size = local_stat.st_size
         if file_size > 100 * 1024 * 1024:
             raise ValueError(f"File too large: {file_size} bytes. Maximum size is 100MB")
             
         try:
-            # Read and encode file
-            with open(local_path, 'rb') as f:
-                file_content = base64.b64encode(f.read()).decode('utf-8')
-                
-            data = {
-                "action": "file_upload",
-                "path": remote_path,
-                "content": file_content
-            }
+            if if_changed and self.remote_file_matches(local_path, remote_path, file_size):
+                return True
             
-            response = self._make_request(data, timeout=120)  # Longer timeout for file uploads
+            if resume:
+                offset = self._partial_upload_size(local_path, remote_path, file_size)
+                if offset:
+                    # Even a complete partial file needs the (empty) final range to replace the target
+                    self._upload_range(local_path, remote_path, offset, file_size - offset, file_size, partial=True)
+                    self._verify_upload(local_path, remote_path)
+                    return True
             
-            if response.get("success"):
+            if parallelism > 1 and file_size >= PARALLEL_UPLOAD_MIN_SIZE:
+                self._upload_ranges(local_path, remote_path, file_size, parallelism)
+                return True
+            
+            compress = (compress and file_size >= COMPRESS_MIN_SIZE and
+                        os.path.splitext(local_path)[1].lower() not in INCOMPRESSIBLE_EXTENSIONS)
+            
+            # Stream the file bytes as the request body
+            try:
+                with open(local_path, 'rb') as f:
+                    if compress:
+                        body = _GzipFileBody(f)
+                        headers = {
+                            'Content-Type': 'application/octet-stream',
+                            'Content-Encoding': 'gzip'
+                        }
+                    else:
+                        body = _FileRange(f, 0, file_size)
+                        headers = {
+                            'Content-Type': 'application/octet-stream',
+                            'Content-Length': str(file_size)
+                        }
+                    with self._file_transfer("POST", remote_path, body=body, headers=headers) as response:
+                        result = _loads(response.read())
+            except _ConnectError:
+                # Nothing was sent, so there is nothing to resume
+                raise
+            except (ConnectionError, socket.timeout, http.client.HTTPException):
+                self._resume_upload(local_path, remote_path, file_size)
+                return True
+            
+            if result.get("success"):
+                # Compressed bodies are hashed while being sent; the server hashes what it wrote
+                if compress and "hash" in result and \
+                        result["hash"] != base64.b64encode(body.digest.digest()).decode('ascii'):
+                    raise RuntimeError("Uploaded file hash does not match the local file")
                 return True
             else:
-                error_msg = response.get("error", "Unknown error")
+                error_msg = result.get("error", "Unknown error")
                 raise RuntimeError(f"Server error: {error_msg}")
                 
         except (ConnectionError, ValueError) as e:
@@ -375,6 +829,125 @@ class RemoteControlClient:
         except Exception as e:
             raise RuntimeError(f"Upload failed: {e}") from e
     
+    def _upload_ranges(self, local_path: str, remote_path: str, file_size: int, parallelism: int):
+        """
+        Upload a file as concurrent byte ranges, then verify the remote copy's hash.
+        
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If the server rejects a range or the hashes don't match
+        """
+        # Imported here to keep it off the startup path of the CLI scripts
+        from concurrent.futures import ThreadPoolExecutor
+        
+        range_size = -(-file_size // parallelism)
+        
+        def send_range(offset: int):
+            self._upload_range(local_path, remote_path, offset, min(range_size, file_size - offset), file_size)
+        
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            # list() re-raises the first failed range
+            list(executor.map(send_range, range(0, file_size, range_size)))
+        
+        self._verify_upload(local_path, remote_path)
+    
+    def _partial_upload_size(self, local_path: str, remote_path: str, file_size: int) -> int:
+        """
+        Return the size of the partial file an interrupted upload left, or 0 if there isn't one.
+        
+        The partial file (remote_path + PARTIAL_UPLOAD_SUFFIX) counts if it is no longer than
+        the local file and its hash matches the same number of bytes at the start of the local
+        file. A complete copy returns file_size.
+        """
+        partial_path = remote_path + PARTIAL_UPLOAD_SUFFIX
+        remote_stat = self.stat_file(partial_path)
+        if not remote_stat["exists"] or not 0 < remote_stat["size"] <= file_size:
+            return 0
+        prefix_size = remote_stat["size"]
+        if self.get_file_info(partial_path).get("hash") != _sha256_base64(local_path, prefix_size):
+            return 0
+        return prefix_size
+    
+    def _resume_upload(self, local_path: str, remote_path: str, file_size: int):
+        """
+        Finish an interrupted upload, sending only the bytes the server has not yet written.
+        
+        The server writes uploads sequentially to a partial file beside the target, so the
+        size of the partial file is the offset to resume from, provided its contents match
+        the start of the local file. If they don't, the whole file is sent again. The server
+        moves the partial file over the target once the last byte is written.
+        
+        Raises:
+            ConnectionError: If every attempt fails to reach the server
+            RuntimeError: If the server rejects the range or the hashes don't match
+        """
+        for attempt, delay in enumerate(UPLOAD_RETRY_DELAYS, 1):
+            time.sleep(delay)
+            try:
+                offset = self._partial_upload_size(local_path, remote_path, file_size)
+                self._upload_range(local_path, remote_path, offset, file_size - offset, file_size, partial=True)
+                self._verify_upload(local_path, remote_path)
+                return
+            except (ConnectionError, socket.timeout, http.client.HTTPException):
+                if attempt == len(UPLOAD_RETRY_DELAYS):
+                    raise
+    
+    def _upload_range(self, local_path: str, remote_path: str, offset: int, length: int, file_size: int,
+                      partial: bool = False):
+        """
+        Write one byte range of a local file into the remote file of size file_size.
+        
+        With partial=True the range goes to the partial file of an interrupted upload, which
+        the server moves over remote_path once it reaches file_size.
+        """
+        headers = {
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(length)
+        }
+        with open(local_path, 'rb') as f:
+            with self._file_transfer("POST", remote_path, body=_FileRange(f, offset, length), headers=headers,
+                                     query={"offset": offset, "size": file_size, "partial": int(partial)}) as response:
+                result = _loads(response.read())
+        if not result.get("success"):
+            raise RuntimeError(f"Server error: {result.get('error', 'Unknown error')}")
+    
+    def _verify_upload(self, local_path: str, remote_path: str):
+        """Raise RuntimeError unless the remote file's hash matches the local file."""
+        remote_info = self.get_file_info(remote_path)
+        if remote_info.get("hash") != _sha256_base64(local_path):
+            raise RuntimeError("Uploaded file hash does not match the local file")
+    
+    def remote_file_matches(self, local_path: str, remote_path: str,
+                            local_size: Optional[int] = None, remote_size: Optional[int] = None) -> bool:
+        """
+        Check whether a remote file has the same contents as a local file.
+        
+        Sizes are compared first, so the file is only hashed (on both sides) when they match.
+        
+        Args:
+            local_path: Path to the local file
+            remote_path: Path to the file on the remote machine
+            local_size: Size of the local file, if already known (saves a stat)
+            remote_size: Size of the remote file, if already known (saves a request)
+            
+        Returns:
+            True if the remote file exists and its SHA-256 matches the local file
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error
+        """
+        if local_size is None:
+            local_size = os.path.getsize(local_path)
+        if remote_size is None:
+            remote_stat = self.stat_file(remote_path)
+            if not remote_stat["exists"]:
+                return False
+            remote_size = remote_stat["size"]
+        if remote_size != local_size:
+            return False
+        return self.get_file_info(remote_path).get("hash") == _sha256_base64(local_path)
+    
     def download_file(self, remote_path: str, local_path: str) -> bool:
         """
         Download a file from the remote Windows machine.
@@ -390,34 +963,24 @@ class RemoteControlClient:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {
-            "action": "file_download",
-            "path": remote_path
-        }
-        
         try:
-            response = self._make_request(data, timeout=120)  # Longer timeout for file downloads
-            
-            if response.get("success"):
-                file_content = response.get("content", "")
-                if not file_content:
-                    raise RuntimeError("No file content received")
-                    
-                # Decode and save file
-                file_bytes = base64.b64decode(file_content)
-                
+            with self._file_transfer("GET", remote_path) as response:
                 # Ensure local directory exists
                 local_dir = os.path.dirname(local_path)
                 if local_dir and not os.path.exists(local_dir):
                     os.makedirs(local_dir)
-                    
+                
+                # Copy the raw response body straight to disk through one reusable buffer
+                buffer = bytearray(TRANSFER_CHUNK_SIZE)
+                view = memoryview(buffer)
                 with open(local_path, 'wb') as f:
-                    f.write(file_bytes)
+                    while True:
+                        read = response.readinto(buffer)
+                        if not read:
+                            break
+                        f.write(view[:read])
                     
-                return True
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
+            return True
                 
         except (ConnectionError, ValueError) as e:
             raise
@@ -438,24 +1001,8 @@ class RemoteControlClient:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {
-            "action": "file_exists",
-            "path": remote_path
-        }
-        
-        try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return response.get("exists", False)
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        return self._cached(("exists", remote_path),
+                            lambda: self._call("file_exists", path=remote_path).get("exists", False))
     
     def get_file_info(self, remote_path: str) -> Dict[str, Any]:
         """
@@ -465,37 +1012,35 @@ class RemoteControlClient:
             remote_path: Path to the file on the remote machine
             
         Returns:
-            Dictionary with file information (name, size, dates, hash)
+            Dictionary with file information (exists, name, size, dates, hash).
+            If the file does not exist, only {"exists": False} is returned.
             
         Raises:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {
-            "action": "file_info",
-            "path": remote_path
-        }
+        return self._cached(("info", remote_path),
+                            lambda: self._file_info(self._call("file_info", path=remote_path), include_hash=True))
+    
+    def stat_file(self, remote_path: str) -> Dict[str, Any]:
+        """
+        Get size and timestamps of a file on the remote machine without hashing it.
         
-        try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return {
-                    "name": response.get("name", ""),
-                    "fullName": response.get("fullName", ""),
-                    "size": response.get("size", 0),
-                    "created": response.get("created", ""),
-                    "modified": response.get("modified", ""),
-                    "hash": response.get("hash", "")
-                }
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+        Cheaper than get_file_info, which makes the server read the whole file.
+        
+        Args:
+            remote_path: Path to the file on the remote machine
+            
+        Returns:
+            Dictionary with file information (exists, name, size, dates).
+            If the file does not exist, only {"exists": False} is returned.
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error
+        """
+        return self._cached(("stat", remote_path),
+                            lambda: self._file_info(self._call("file_stat", path=remote_path), include_hash=False))
     
     def delete_file(self, remote_path: str) -> bool:
         """
@@ -505,30 +1050,16 @@ class RemoteControlClient:
             remote_path: Path to the file to delete on the remote machine
             
         Returns:
-            True if successful, False otherwise
+            True if the file was deleted, False if it did not exist
             
         Raises:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {
-            "action": "file_delete",
-            "path": remote_path
-        }
-        
         try:
-            response = self._make_request(data)
-            
-            if response.get("success"):
-                return True
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
+            return self._call("file_delete", path=remote_path).get("exists", True)
+        finally:
+            self.invalidate(remote_path)
     
     def list_files(self, remote_path: str, pattern: str = "*") -> list:
         """
@@ -545,22 +1076,182 @@ class RemoteControlClient:
             ConnectionError: If unable to connect to server
             RuntimeError: If server returns an error
         """
-        data = {
-            "action": "file_list",
-            "path": remote_path,
-            "pattern": pattern
-        }
+        return self._cached(("list", remote_path, pattern),
+                            lambda: self._call("file_list", path=remote_path, pattern=pattern).get("files", []))
+    
+    def list_files_detailed(self, remote_path: str, pattern: str = "*",
+                            include_hash: bool = False) -> List[Dict[str, Any]]:
+        """
+        List files in a directory on the remote machine along with their information.
+        
+        Returns in one request what would otherwise take list_files plus a get_file_info
+        call per file.
+        
+        Args:
+            remote_path: Path to the directory on the remote machine
+            pattern: File pattern to match (default: "*")
+            include_hash: Also return each file's SHA-256, which makes the server read every file
+            
+        Returns:
+            List of dictionaries with file information (name, fullName, size, created,
+            modified, and hash if requested)
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error
+        """
+        return self._cached(("list_detail", remote_path, pattern, include_hash),
+                            lambda: self._call("file_list_detail", path=remote_path, pattern=pattern,
+                                               include_hash=include_hash).get("files", []))
+    
+    def batch(self, requests: List[Dict[str, Any]], timeout: float = 30) -> List[Dict[str, Any]]:
+        """
+        Send several actions to the server in a single request.
         
+        Each request is a dictionary as accepted by the server (e.g.
+        {"action": "file_exists", "path": "C:/temp/a.txt"}) and is answered exactly as if
+        it had been sent on its own. Batches cannot be nested.
+        
+        Args:
+            requests: Actions to perform, in order
+            timeout: Socket timeout in seconds for the whole batch
+            
+        Returns:
+            The server's response to each request, in the same order. Individual responses
+            may have "success": False without the batch failing.
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error
+        """
+        if not requests:
+            return []
         try:
-            response = self._make_request(data)
+            return self._call("batch", timeout=timeout, requests=requests).get("results", [])
+        finally:
+            if any(request.get("action") not in _READ_ONLY_ACTIONS for request in requests):
+                self.invalidate()
+    
+    def _batch_results(self, action: str, remote_paths: List[str]) -> List[Dict[str, Any]]:
+        """Run one path-based action for each path in a single batch, raising on the first failure."""
+        results = self.batch([{"action": action, "path": path} for path in remote_paths])
+        for result in results:
+            if not result.get("success"):
+                raise RuntimeError(f"Server error: {result.get('error', 'Unknown error')}")
+        return results
+    
+    def file_exists_many(self, remote_paths: List[str]) -> List[bool]:
+        """
+        Check whether several files exist on the remote machine, in one request.
+        
+        Args:
+            remote_paths: Paths to check on the remote machine
             
-            if response.get("success"):
-                return response.get("files", [])
-            else:
-                error_msg = response.get("error", "Unknown error")
-                raise RuntimeError(f"Server error: {error_msg}")
-                
-        except (ConnectionError, ValueError) as e:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {e}") from e
\ No newline at end of file
+        Returns:
+            Whether each file exists, in the same order
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error
+        """
+        return [result.get("exists", False) for result in self._batch_results("file_exists", remote_paths)]
+    
+    def get_file_info_many(self, remote_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get information about several files on the remote machine, in one request.
+        
+        Args:
+            remote_paths: Paths to the files on the remote machine
+            
+        Returns:
+            File information for each path, in the same order (see get_file_info)
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error
+        """
+        return [self._file_info(result, include_hash=True)
+                for result in self._batch_results("file_info", remote_paths)]
+    
+    def iter_files(self, remote_path: str, pattern: str = "*", timeout: float = 120) -> Iterator[str]:
+        """
+        List files in a directory on the remote machine, yielding paths as the server sends them.
+        
+        Unlike list_files, the server streams the listing while it is still enumerating the
+        directory, so large directories can be processed before the listing completes.
+        
+        Args:
+            remote_path: Path to the directory on the remote machine
+            pattern: File pattern to match (default: "*")
+            timeout: Socket timeout in seconds
+            
+        Yields:
+            File paths
+            
+        Raises:
+            ConnectionError: If unable to connect to server
+            RuntimeError: If server returns an error
+        """
+        query = urllib.parse.urlencode({"path": remote_path, "pattern": pattern})
+        
+        try:
+            with self._request("GET", f"/files?{query}", timeout=timeout) as response:
+                self._check_response(response)
+                for line in response:
+                    if line.strip():
+                        yield _loads(line)
+                        
+        except (http.client.HTTPException, socket.timeout) as e:
+            raise ConnectionError(f"HTTP request failed: {e}") from e
+
+
+class AsyncRemoteControlClient:
+    """
+    Asyncio interface to the Remote Control server.
+    
+    Every public RemoteControlClient method is available as a coroutine that runs the
+    blocking call in a worker thread, so many requests can be in flight at once over
+    the underlying client's connection pool, e.g.:
+    
+        async with AsyncRemoteControlClient() as client:
+            infos = await client.get_file_info_many(paths)
+    
+    The generator methods (iter_files, iter_shell_output) are not available.
+    """
+    
+    def __init__(self, host: str = "localhost", port: int = 8417, cache_ttl: float = 0.0):
+        """
+        Initialize the async client.
+        
+        Args:
+            host: The hostname to connect to (default: localhost)
+            port: The port to connect to (default: 8417)
+            cache_ttl: Seconds to reuse query results (see RemoteControlClient)
+        """
+        self.client = RemoteControlClient(host, port, cache_ttl=cache_ttl)
+        self.host = host
+        self.port = port
+    
+    def __getattr__(self, name: str):
+        # Imported here to keep them off the startup path of the CLI scripts
+        import asyncio
+        import inspect
+        
+        method = getattr(self.client, name)
+        if name.startswith("_") or not callable(method) or inspect.isgeneratorfunction(method):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+        return call
+    
+    async def close(self):
+        """Close the underlying client's pooled connections."""
+        self.client.close()
+    
+    async def __aenter__(self) -> "AsyncRemoteControlClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
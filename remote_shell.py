@@ -19,11 +19,26 @@ Example:
 
 import argparse
 import sys
-import time
 import signal
+import threading
+import time
 from typing import Optional
 from remote_control_client import RemoteControlClient
 
+# How long each output poll may wait on the server for new output
+OUTPUT_WAIT_MS = 500
+
+# Backoff (seconds) between polls when the server answers empty without waiting
+MIN_POLL_DELAY = 0.05
+MAX_POLL_DELAY = 1.0
+
+# Longest backoff (seconds) between retries while output polls are failing
+MAX_RETRY_DELAY = 5.0
+
+# ANSI escapes wrapped around stderr text
+ERROR_COLOR = "\033[91m"
+RESET_COLOR = "\033[0m"
+
 
 class RemoteShell:
     """Interactive remote shell interface."""
@@ -71,6 +86,9 @@ class RemoteShell:
         print("=" * 50)
         
         self.running = True
+        
+        # Drain output in the background so it shows up while the user is typing
+        threading.Thread(target=self._output_loop, daemon=True).start()
         self._run_shell_loop()
         return True
         
@@ -83,9 +101,6 @@ class RemoteShell:
         """Main shell interaction loop."""
         while self.running:
             try:
-                # Get any pending output first
-                self._flush_output()
-                
                 # Get user input
                 try:
                     command = input("remote> ")
@@ -104,10 +119,6 @@ class RemoteShell:
                 try:
                     self.client.send_shell_input(command)
                     
-                    # Give the command time to execute and get output
-                    time.sleep(0.1)
-                    self._flush_output()
-                    
                 except Exception as e:
                     print(f"Error sending command: {e}")
                     break
@@ -122,21 +133,47 @@ class RemoteShell:
                 
         self.stop()
         
-    def _flush_output(self):
-        """Get and display any pending output from the remote shell."""
-        try:
-            result = self.client.get_shell_output()
+    def _output_loop(self):
+        """Display output from the remote shell as it arrives, until the session ends."""
+        delay = MIN_POLL_DELAY
+        retry_delay = 0.0
+        while self.running:
+            started = time.monotonic()
+            try:
+                result = self.client.get_shell_output(wait_ms=OUTPUT_WAIT_MS)
+            except Exception as e:
+                # Keep retrying so a transient network error doesn't silence the session
+                if self.running and not retry_delay:
+                    print(f"\nError getting output: {e} (retrying)")
+                retry_delay = min(retry_delay * 2 or MIN_POLL_DELAY, MAX_RETRY_DELAY)
+                time.sleep(retry_delay)
+                continue
+            if retry_delay:
+                retry_delay = 0.0
+                print("\nOutput connection restored.")
+            if result["output"] or result["error"]:
+                delay = MIN_POLL_DELAY
+                self._print_output(result)
+            elif time.monotonic() - started < OUTPUT_WAIT_MS / 2000:
+                # The server didn't wait (e.g. an older server), so don't poll it in a tight loop
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_POLL_DELAY)
             
-            # Display stdout
-            if result["output"].strip():
-                print(result["output"], end='')
-                
-            # Display stderr in red if available
-            if result["error"].strip():
-                print(f"\033[91m{result['error']}\033[0m", end='')
-                
-        except Exception as e:
-            print(f"Error getting output: {e}")
+    def _print_output(self, result: dict):
+        """Display shell output, with stderr in red."""
+        output = result["output"]
+        error = result["error"]
+        if not output and not error:
+            return
+            
+        # Write both streams, then flush the terminal once
+        if output:
+            sys.stdout.write(output)
+        if error:
+            sys.stdout.write(ERROR_COLOR)
+            sys.stdout.write(error)
+            sys.stdout.write(RESET_COLOR)
+        sys.stdout.flush()
             
     def stop(self):
         """Stop the shell session."""
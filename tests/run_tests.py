@@ -9,15 +9,16 @@ a summary of results.
 import sys
 import os
 import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Tuple
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 def run_test(test_file: str) -> Tuple[str, bool, str]:
     """
     Run a single test file and return results.
     
+    Output is captured rather than printed, so several tests can run at once.
+    
     Args:
         test_file: Path to the test file
         
@@ -27,10 +28,6 @@ def run_test(test_file: str) -> Tuple[str, bool, str]:
     test_name = os.path.basename(test_file).replace('.py', '').replace('test_', '')
     
     try:
-        print(f"\n{'='*60}")
-        print(f"Running {test_name.upper()} tests...")
-        print('='*60)
-        
         result = subprocess.run(
             [sys.executable, test_file], 
             capture_output=True, 
@@ -42,18 +39,14 @@ def run_test(test_file: str) -> Tuple[str, bool, str]:
         if result.stderr:
             output += f"\nSTDERR:\n{result.stderr}"
         
-        print(output)
-        
         success = result.returncode == 0
         return test_name, success, output
         
     except subprocess.TimeoutExpired:
         error_msg = f"Test {test_name} timed out after 60 seconds"
-        print(error_msg)
         return test_name, False, error_msg
     except Exception as e:
         error_msg = f"Error running test {test_name}: {e}"
-        print(error_msg)
         return test_name, False, error_msg
 
 def main():
@@ -62,11 +55,8 @@ def main():
     print("=" * 60)
     
     # Find all test files
-    test_dir = os.path.dirname(os.path.abspath(__file__))
-    test_files = [
-        os.path.join(test_dir, f) for f in os.listdir(test_dir)
-        if f.startswith('test_') and f.endswith('.py') and f != 'run_tests.py'
-    ]
+    test_dir = Path(__file__).resolve().parent
+    test_files = sorted(str(path) for path in test_dir.glob('test_*.py'))
     
     if not test_files:
         print("No test files found!")
@@ -76,12 +66,20 @@ def main():
     for test_file in test_files:
         print(f"  - {os.path.basename(test_file)}")
     
-    # Run all tests
+    # Run all tests concurrently; each is an independent subprocess
     results: List[Tuple[str, bool, str]] = []
     
-    for test_file in sorted(test_files):
-        test_name, success, output = run_test(test_file)
-        results.append((test_name, success, output))
+    with ThreadPoolExecutor(max_workers=len(test_files)) as executor:
+        futures = [executor.submit(run_test, test_file) for test_file in test_files]
+        for future in as_completed(futures):
+            test_name, success, output = future.result()
+            print(f"\n{'='*60}")
+            print(f"{test_name.upper()} tests")
+            print('='*60)
+            print(output)
+            results.append((test_name, success, output))
+    
+    results.sort()
     
     # Print summary
     print("\n" + "="*60)
@@ -6,8 +6,6 @@ This script tests file operations without requiring the Windows app to be runnin
 
 import sys
 import os
-import tempfile
-import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from remote_control_client import RemoteControlClient
 
@@ -50,6 +48,7 @@ def test_file_operations():
             
         # Test file exists
         print("\n3. Testing file exists check...")
+        exists = False
         try:
             exists = client.file_exists(remote_path)
             print(f"✓ Remote file exists: {exists}")
@@ -59,8 +58,9 @@ def test_file_operations():
         # Test file info
         print("\n4. Testing file info...")
         try:
-            if client.file_exists(remote_path):
-                file_info = client.get_file_info(remote_path)
+            # file_info reports existence itself, so no separate exists check is needed
+            file_info = client.get_file_info(remote_path)
+            if file_info["exists"]:
                 print(f"✓ File info retrieved:")
                 print(f"  Name: {file_info['name']}")
                 print(f"  Size: {file_info['size']} bytes")
@@ -76,7 +76,7 @@ def test_file_operations():
         print("\n5. Testing file download...")
         try:
             download_path = "downloaded_test_file.txt"
-            if client.file_exists(remote_path):
+            if exists:
                 success = client.download_file(remote_path, download_path)
                 if success:
                     print(f"✓ File downloaded to {download_path}")
@@ -104,9 +104,10 @@ def test_file_operations():
         try:
             files = client.list_files("C:/temp/", "*.txt")
             print(f"✓ Found {len(files)} .txt files in C:/temp/:")
-            for file_path in files[:5]:  # Show first 5 files
-                filename = os.path.basename(file_path)
-                print(f"  {filename}")
+            if files:
+                # Show first 5 files; remote paths use Windows separators, which os.path.basename
+                # only splits on Windows
+                print("\n".join("  " + file_path.rpartition("\\")[2].rpartition("/")[2] for file_path in files[:5]))
             if len(files) > 5:
                 print(f"  ... and {len(files) - 5} more")
                 
@@ -116,7 +117,7 @@ def test_file_operations():
         # Test file deletion
         print("\n7. Testing file deletion...")
         try:
-            if client.file_exists(remote_path):
+            if exists:
                 success = client.delete_file(remote_path)
                 if success:
                     print(f"✓ Remote file deleted")
@@ -161,9 +162,6 @@ def test_file_copy_script():
     
     # Import the FileCopyTool
     try:
-        import sys
-        import os
-        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         from file_copy import FileCopyTool
         
         # Create tool
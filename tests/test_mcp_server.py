@@ -15,54 +15,71 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Try to import the MCP server
 try:
-    from WinRemoteMcpServer import WinRemoteMCPServer
-    from mcp.types import TextContent
+    from WinRemoteMcpServer import WinRemoteMCPServer, _install_uvloop
+    from mcp.types import CallToolRequest, ListToolsRequest, TextContent
 except ImportError as e:
     print(f"Error importing MCP components: {e}")
     print("Please install the MCP package: pip install mcp")
     sys.exit(1)
 
+# The server script lives in the repository root, one level above this file
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "WinRemoteMcpServer.py")
 
-async def test_mcp_server():
-    """Test the MCP server functionality."""
-    print("Testing Windows Remote Control MCP Server")
+# Claude Desktop config snippet printed after a successful run
+CONFIG_TEMPLATE = """   {{
+     "mcpServers": {{
+       "windows-remote": {{
+         "command": "python",
+         "args": ["{path}"]
+       }}
+     }}
+   }}"""
+
+
+def _decode(result) -> Dict[str, Any]:
+    """Parse the JSON text of a tool's response."""
+    return json.loads(result[0].text)
+
+
+def test_tool_listing(server) -> bool:
+    """Check that the tool handlers are registered; the async tests need them."""
+    print("\nTesting Windows Remote Control MCP Server")
     print("=" * 50)
     
-    # Create server instance
-    server = WinRemoteMCPServer()
-    print("✓ MCP Server created successfully")
-    
     # Test tool listing
     print("\n1. Testing tool listing...")
     try:
         # Check the newer MCP server API
         server_obj = server.server
+        handlers = server_obj.request_handlers
         
         # Check if handlers are registered in the request_handlers (newer MCP API uses classes)
-        from mcp.types import ListToolsRequest, CallToolRequest
-        
-        has_list_tools = ListToolsRequest in server_obj.request_handlers
-        has_call_tool = CallToolRequest in server_obj.request_handlers
+        has_list_tools = ListToolsRequest in handlers
+        has_call_tool = CallToolRequest in handlers
         
         if has_list_tools and has_call_tool:
             print("✓ Tool handlers registered successfully")
             print("✓ Server appears to have tools configured")
-            print(f"✓ Request handlers: {list(server_obj.request_handlers.keys())}")
+            print(f"✓ Request handlers: {list(handlers)}")
             
             # Check tool cache if available
             if hasattr(server_obj, '_tool_cache') and server_obj._tool_cache:
                 print(f"✓ Tool cache contains {len(server_obj._tool_cache)} tools")
+            return True
         else:
             print(f"✗ Tool handlers not properly registered")
             print(f"  has_list_tools (ListToolsRequest): {has_list_tools}")
             print(f"  has_call_tool (CallToolRequest): {has_call_tool}")
-            print(f"  Available handlers: {list(server_obj.request_handlers.keys())}")
+            print(f"  Available handlers: {list(handlers)}")
             return False
             
     except Exception as e:
         print(f"✗ Tool listing failed: {e}")
         return False
-    
+
+
+async def test_mcp_server(server):
+    """Test the MCP server functionality; assumes test_tool_listing passed."""
     # Test connection configuration
     print("\n2. Testing connection configuration...")
     try:
@@ -71,8 +88,7 @@ async def test_mcp_server():
             "host": "localhost",
             "port": 8417
         })
-        response_text = result[0].text
-        response_data = json.loads(response_text)
+        response_data = _decode(result)
         print(f"✓ Connection configured: {response_data['host']}:{response_data['port']}")
     except Exception as e:
         print(f"✗ Connection configuration failed: {e}")
@@ -81,8 +97,7 @@ async def test_mcp_server():
     print("\n3. Testing connection test...")
     try:
         result = await server._test_connection({})
-        response_text = result[0].text
-        response_data = json.loads(response_text)
+        response_data = _decode(result)
         
         if response_data["connected"]:
             print("✓ Connection test successful - Remote Control app is running")
@@ -104,56 +119,46 @@ async def test_connected_functionality(server):
     """Test functionality that requires a connection."""
     print("\n4. Testing connected functionality...")
     
-    # Test status
-    try:
-        result = await server._get_status({})
-        response_text = result[0].text
-        response_data = json.loads(response_text)
-        print(f"✓ Status retrieved - Shell running: {response_data.get('shell_running', False)}")
-    except Exception as e:
-        print(f"✗ Status test failed: {e}")
+    # (label, tool call, description of the parsed response); the file existence check is a safe operation
+    probes = [
+        ("Status", server._get_status({}),
+         lambda data: f"Shell running: {data.get('shell_running', False)}"),
+        ("Shell status", server._shell_status({}),
+         lambda data: data.get('status', 'unknown')),
+        ("File exists check", server._file_exists({"path": "C:/Windows/System32"}),
+         lambda data: f"C:/Windows/System32 exists: {data.get('exists', False)}"),
+    ]
     
-    # Test shell status
-    try:
-        result = await server._shell_status({})
-        response_text = result[0].text
-        response_data = json.loads(response_text)
-        print(f"✓ Shell status: {response_data.get('status', 'unknown')}")
-    except Exception as e:
-        print(f"✗ Shell status test failed: {e}")
+    # The probes are independent, so run them concurrently
+    results = await asyncio.gather(*(call for _, call, _ in probes), return_exceptions=True)
     
-    # Test file existence check (safe operation)
-    try:
-        result = await server._file_exists({"path": "C:/Windows/System32"})
-        response_text = result[0].text
-        response_data = json.loads(response_text)
-        print(f"✓ File exists check - C:/Windows/System32 exists: {response_data.get('exists', False)}")
-    except Exception as e:
-        print(f"✗ File exists test failed: {e}")
+    for (label, _, describe), result in zip(probes, results):
+        try:
+            if isinstance(result, Exception):
+                raise result
+            print(f"✓ {label} - {describe(_decode(result))}")
+        except Exception as e:
+            print(f"✗ {label} test failed: {e}")
 
 
-def test_tool_schemas():
+def test_tool_schemas(server):
     """Test that tool schemas are valid."""
     print("\n5. Testing tool schemas...")
     
     try:
-        server = WinRemoteMCPServer()
-        
         # Check the newer MCP server API
-        server_obj = server.server
+        handlers = server.server.request_handlers
         
         # Check that handlers are registered
-        from mcp.types import ListToolsRequest, CallToolRequest
-        
-        has_list_tools = ListToolsRequest in server_obj.request_handlers
-        has_call_tool = CallToolRequest in server_obj.request_handlers
+        has_list_tools = ListToolsRequest in handlers
+        has_call_tool = CallToolRequest in handlers
         
         if has_list_tools and has_call_tool:
             print("✓ Tool schemas appear to be valid (handlers registered successfully)")
             print("✓ Server structure is correct")
         else:
             print("✗ Tool handlers not properly registered")
-            print(f"  Available handlers: {list(server_obj.request_handlers.keys())}")
+            print(f"  Available handlers: {list(handlers)}")
             
     except Exception as e:
         print(f"✗ Schema validation failed: {e}")
@@ -162,11 +167,20 @@ def test_tool_schemas():
 def main():
     """Main test function."""
     try:
+        # Every test takes this one server instance as a parameter; pass it to new tests
+        # rather than constructing another, which would register all the tools again
+        server = WinRemoteMCPServer()
+        print("✓ MCP Server created successfully")
+        
         # Test schemas
-        test_tool_schemas()
+        test_tool_schemas(server)
         
-        # Test server functionality
-        success = asyncio.run(test_mcp_server())
+        # Check handler registration synchronously, so a broken server skips the event loop entirely
+        success = test_tool_listing(server)
+        if success:
+            # Test server functionality, on the same event loop the server uses
+            _install_uvloop()
+            success = asyncio.run(test_mcp_server(server))
         
         print("\n" + "=" * 50)
         if success:
@@ -174,14 +188,7 @@ def main():
             print("\nTo use with Claude Desktop:")
             print("1. Install MCP: pip install mcp")
             print("2. Add to Claude Desktop MCP config:")
-            print("   {")
-            print('     "mcpServers": {')
-            print('       "windows-remote": {')
-            print('         "command": "python",')
-            print(f'         "args": ["{__file__.replace("test_mcp_server.py", "WinRemoteMcpServer.py")}"]')
-            print('       }')
-            print('     }')
-            print("   }")
+            print(CONFIG_TEMPLATE.format(path=SERVER_SCRIPT))
             sys.exit(0)
         else:
             print("✗ MCP Server tests failed")
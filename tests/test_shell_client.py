@@ -5,7 +5,6 @@ This script tests the shell API without requiring the Windows app to be running.
 """
 
 import sys
-import time
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from remote_control_client import RemoteControlClient
@@ -45,22 +44,19 @@ def test_shell_api():
         except Exception as e:
             print(f"✗ Shell start failed: {e}")
             
-        # Test sending input
-        print("\n4. Testing shell input...")
+        # Test running a one-shot command: input and output in a single request
+        print("\n4. Testing shell exec...")
         try:
-            client.send_shell_input("echo Hello from remote shell!")
-            print("✓ Input sent successfully!")
+            result = client.exec_command("echo Hello from remote shell!", timeout_ms=2000)
+            print("✓ Command executed successfully!")
             
-            # Wait and get output
-            time.sleep(1)
-            result = client.get_shell_output()
             if result["output"]:
                 print(f"✓ Output received: {result['output'].strip()}")
             if result["error"]:
                 print(f"! Error output: {result['error'].strip()}")
                 
         except Exception as e:
-            print(f"✗ Shell input/output failed: {e}")
+            print(f"✗ Shell exec failed: {e}")
             
         # Test complex command with quotes and backslashes
         print("\n4b. Testing complex command with quotes...")
@@ -69,9 +65,8 @@ def test_shell_api():
             client.send_shell_input(complex_cmd)
             print(f"✓ Complex command sent: {complex_cmd}")
             
-            # Wait and get output
-            time.sleep(1)
-            result = client.get_shell_output()
+            # Wait for output; returns as soon as the shell produces some
+            result = client.get_shell_output(wait_ms=1000)
             if result["output"]:
                 print(f"✓ Output received: {result['output'].strip()}")
             if result["error"]: